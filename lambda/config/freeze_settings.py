@@ -0,0 +1,74 @@
+"""
+Genera el snapshot congelado de configuracion (config/_settings_frozen.py).
+
+Se ejecuta una vez en build/deploy, desde el directorio lambda/:
+
+    python -m config.freeze_settings
+
+Resuelve Settings con el .env y las variables de entorno actuales,
+valida la configuracion y escribe los valores resueltos como literales
+de Python. En runtime, settings.py carga ese modulo (servido desde .pyc)
+en lugar de parsear .env y hacer los casts en cada cold start.
+
+Los secretos (API keys, credenciales AWS) no se escriben: en runtime se
+leen siempre del entorno. El snapshot guarda ademas las variables de
+entorno crudas con las que se genero (SOURCE_ENV); si en runtime alguna
+tiene otro valor, settings.py lo descarta y lee el entorno.
+
+Para volver a leer .env en runtime basta con borrar el snapshot.
+"""
+
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+FROZEN_MODULE_PATH = Path(__file__).parent / '_settings_frozen.py'
+
+FROZEN_HEADER = '''"""
+Snapshot congelado de configuracion para Doctor de Errores.
+
+GENERADO por `python -m config.freeze_settings`. No editar a mano.
+"""
+
+'''
+
+
+def freeze_settings() -> Path:
+    """
+    Resuelve la configuracion actual y la escribe como literales.
+
+    Returns:
+        Ruta del snapshot generado
+
+    Raises:
+        ValueError: Si la configuracion es invalida
+    """
+    # Nunca partir de un snapshot anterior: leer siempre .env y entorno
+    if FROZEN_MODULE_PATH.exists():
+        FROZEN_MODULE_PATH.unlink()
+
+    from config.settings import _ENV_VARS, _SECRET_FIELDS, get_settings
+
+    # get_settings() carga .env y valida (lanza ValueError si es invalida)
+    values = asdict(get_settings())
+
+    source_env = {
+        env_var: os.environ[env_var]
+        for name, env_var in _ENV_VARS.items()
+        if name not in _SECRET_FIELDS and env_var in os.environ
+    }
+
+    lines = [FROZEN_HEADER]
+    for name, value in values.items():
+        if name not in _SECRET_FIELDS:
+            lines.append(f"{name.upper()} = {value!r}\n")
+    lines.append(f"SOURCE_ENV = {source_env!r}\n")
+
+    FROZEN_MODULE_PATH.write_text(''.join(lines), encoding='utf-8')
+    return FROZEN_MODULE_PATH
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    print(f"Snapshot de configuracion generado en: {freeze_settings()}")
@@ -5,58 +5,39 @@ Este modulo contiene todas las configuraciones de la aplicacion,
 incluyendo settings de AI, DynamoDB, logging, etc.
 
 Las configuraciones pueden ser sobrescritas con variables de entorno.
+
+La configuracion se resuelve de forma lazy: importar este modulo no lee
+.env ni valida nada. El singleton Settings se construye la primera vez
+que se llama a get_settings() o que se accede a una constante del modulo
+(por ejemplo `from config.settings import KB_CONFIDENCE_THRESHOLD`).
 """
 
+import logging
 import os
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from enum import Enum
-
-
-class AIProvider(Enum):
-    """Providers de IA soportados."""
-    BEDROCK = "bedrock"
-    OPENAI = "openai"
-    MOCK = "mock"  # Para testing
-
-
-# Cargar variables de entorno desde .env
-try:
-    from dotenv import load_dotenv
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
-    # Buscar .env en el directorio lambda/
-    env_path = Path(__file__).parent.parent / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        print(f"Variables de entorno cargadas desde: {env_path}")
-    else:
-        print(f"Archivo .env no encontrado en: {env_path}")
-        print("Usando variables de entorno del sistema o valores por defecto")
-except ImportError:
-    print("python-dotenv no instalado. Usando variables de entorno del sistema.")
-except Exception as e:
-    print(f"Error cargando .env: {e}")
+# Logger estandar: importar utils aqui arrastraria boto3 al cargar settings
+logger = logging.getLogger(__name__)
 
 
-# ============================================================================
-# CONFIGURACION GENERAL
-# ============================================================================
+# Providers de IA soportados ("mock" para testing)
+AI_PROVIDERS = ("bedrock", "openai", "mock")
 
-# Entorno de ejecucion (development, staging, production)
-ENVIRONMENT = os.getenv('ENVIRONMENT', 'production')
-IS_PRODUCTION = ENVIRONMENT == 'production'
-IS_DEVELOPMENT = ENVIRONMENT == 'development'
+# Alias de tipo para anotaciones (sin costo en runtime)
+AIProviderName = Literal["bedrock", "openai", "mock"]
 
-# Logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+# Algoritmos soportados para el hash de errores (claves de cache)
+_CACHE_HASH_ALGOS = frozenset({'blake2b', 'sha256'})
 
 
 # ============================================================================
-# CONFIGURACION DE KNOWLEDGE BASE
+# CONSTANTES (no dependen del entorno)
 # ============================================================================
 
-# Umbral de confianza para match en KB (0.0 - 1.0)
-KB_CONFIDENCE_THRESHOLD = float(os.getenv('KB_CONFIDENCE_THRESHOLD', '0.60'))
-
 # Path a KB templates (relativo a este archivo)
 KB_TEMPLATES_PATH = os.path.join(
     os.path.dirname(__file__),
@@ -64,100 +45,381 @@ KB_TEMPLATES_PATH = os.path.join(
 )
 
 MAX_SOLUTIONS = 5
+MAX_CARD_TITLE_LENGTH = 100
+
 
 # ============================================================================
-# CONFIGURACION DE AI SERVICE
+# SETTINGS (dependen del entorno)
 # ============================================================================
 
-# Provider preferido (bedrock, openai, mock)
-AI_PROVIDER = os.getenv('AI_PROVIDER', 'openai')
+def _parse_bool(raw: str) -> bool:
+    """Interpreta 'true' (sin importar mayusculas) como True."""
+    return raw.lower() == 'true'
 
-# AWS Bedrock
-BEDROCK_REGION = os.getenv('BEDROCK_REGION', 'us-east-1')
-BEDROCK_MODEL_ID = os.getenv(
-    'BEDROCK_MODEL_ID',
-    'anthropic.claude-3-haiku-20240307-v1:0'
-)
-BEDROCK_MAX_TOKENS = int(os.getenv('BEDROCK_MAX_TOKENS', '1000'))
-BEDROCK_TEMPERATURE = float(os.getenv('BEDROCK_TEMPERATURE', '0.3'))
 
-# OpenAI
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
-OPENAI_MAX_TOKENS = int(os.getenv('OPENAI_MAX_TOKENS', '350'))
-OPENAI_TEMPERATURE = float(os.getenv('OPENAI_TEMPERATURE', '0.2'))
+def _parse_list(raw: str) -> Tuple[str, ...]:
+    """Separa una lista por comas, sin espacios ni entradas vacias."""
+    return tuple(item.strip() for item in raw.split(',') if item.strip())
 
 
-# ============================================================================
-# CONFIGURACION DE STORAGE (DYNAMODB)
-# ============================================================================
+def _env(
+    name: str,
+    default: Any,
+    cast: Optional[Callable[[str], Any]] = None
+) -> Any:
+    """
+    Lee una variable de entorno ya convertida a su tipo.
 
-# AWS Credentials (para Alexa-hosted con DynamoDB externa)
-# Si no se proporcionan, se usara IAM Role (self-hosted Lambda)
-EXT_AWS_ACCESS_KEY_ID = os.getenv('EXT_AWS_ACCESS_KEY_ID')
-EXT_AWS_SECRET_ACCESS_KEY = os.getenv('EXT_AWS_SECRET_ACCESS_KEY')
-AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
+    El default se pasa ya tipado: solo se castea el valor crudo cuando la
+    variable existe.
 
-# DynamoDB
-DYNAMODB_TABLE_NAME = os.getenv('DYNAMODB_TABLE', 'DoctorErrores_Users')
-DYNAMODB_ENDPOINT = os.getenv('DYNAMODB_ENDPOINT')  # Para testing local
-ENABLE_STORAGE = os.getenv('ENABLE_STORAGE', 'true').lower() == 'true'
+    Args:
+        name: Nombre de la variable de entorno
+        default: Valor si la variable no esta definida
+        cast: Conversion del valor crudo (default: str sin convertir)
 
+    Returns:
+        Valor de la variable convertido, o el default
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
 
-# ============================================================================
-# CONFIGURACION DE RESPUESTAS
-# ============================================================================
+    return cast(raw) if cast else raw
 
-# Limites de texto
-MAX_VOICE_LENGTH = int(os.getenv('MAX_VOICE_LENGTH', '300'))
-MAX_CARD_LENGTH = int(os.getenv('MAX_CARD_LENGTH', '1000'))
-MAX_CARD_CONTENT_LENGTH = int(os.getenv('MAX_CARD_CONTENT_LENGTH', '8000'))
-MAX_VOICE_TEXT_LENGTH = MAX_VOICE_LENGTH
-MAX_CARD_TEXT_LENGTH = MAX_CARD_LENGTH
-MAX_CARD_TITLE_LENGTH = 100
 
+@dataclass(frozen=True)
+class Settings:
+    """
+    Configuracion inmutable resuelta desde el entorno.
+
+    Attributes:
+        environment: Entorno de ejecucion (development, staging, production)
+        log_level: Nivel de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        kb_confidence_threshold: Umbral de confianza para match en KB (0.0 - 1.0)
+        ai_provider: Provider preferido (bedrock, openai, mock)
+        ai_provider_chain: Providers de IA en orden ("bedrock:<model_id>",
+            "openai:<modelo>", "mock"); vacio = OpenAI y luego mock
+        ai_provider_hedge_seconds: Espera por provider antes de lanzar el siguiente
+        bedrock_region: Region de AWS Bedrock
+        bedrock_model_id: Modelo de Bedrock
+        bedrock_max_tokens: Tokens maximos de Bedrock
+        bedrock_temperature: Temperatura de Bedrock
+        bedrock_latency_optimized: Pedir inferencia optimizada para latencia
+        openai_api_key: API key de OpenAI
+        openai_model: Modelo de OpenAI
+        openai_max_tokens: Tokens maximos de OpenAI
+        openai_temperature: Temperatura de OpenAI
+        ext_aws_access_key_id: Credencial AWS explicita (Alexa-hosted)
+        ext_aws_secret_access_key: Credencial AWS explicita (Alexa-hosted)
+        aws_region: Region de AWS para DynamoDB
+        dynamodb_table_name: Tabla de DynamoDB
+        dynamodb_endpoint: Endpoint de DynamoDB (testing local)
+        enable_storage: Habilitar persistencia en DynamoDB
+        max_voice_length: Longitud maxima de texto de voz
+        max_card_length: Longitud maxima de texto de card
+        max_card_content_length: Longitud maxima de contenido de card
+        cache_hash_algo: Algoritmo del hash de errores (blake2b, sha256)
+    """
+    environment: str
+    log_level: str
+    kb_confidence_threshold: float
+    ai_provider: AIProviderName
+    ai_provider_chain: Tuple[str, ...]
+    ai_provider_hedge_seconds: float
+    bedrock_region: str
+    bedrock_model_id: str
+    bedrock_max_tokens: int
+    bedrock_temperature: float
+    bedrock_latency_optimized: bool
+    openai_api_key: Optional[str]
+    openai_model: str
+    openai_max_tokens: int
+    openai_temperature: float
+    ext_aws_access_key_id: Optional[str]
+    ext_aws_secret_access_key: Optional[str]
+    aws_region: str
+    dynamodb_table_name: str
+    dynamodb_endpoint: Optional[str]
+    enable_storage: bool
+    max_voice_length: int
+    max_card_length: int
+    max_card_content_length: int
+    cache_hash_algo: str
+
+    @property
+    def is_production(self) -> bool:
+        """True si el entorno es production."""
+        return self.environment == 'production'
+
+    @property
+    def is_development(self) -> bool:
+        """True si el entorno es development."""
+        return self.environment == 'development'
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Construye Settings leyendo las variables de entorno.
+
+        Returns:
+            Settings con los valores del entorno o por defecto
+        """
+        environment = _env('ENVIRONMENT', 'production')
+        is_development = environment == 'development'
+
+        return cls(
+            environment=environment,
+            # En desarrollo, usar logs mas verbosos
+            log_level='DEBUG' if is_development else _env('LOG_LEVEL', 'INFO'),
+            kb_confidence_threshold=_env('KB_CONFIDENCE_THRESHOLD', 0.60, float),
+            # Usar mock AI por defecto en desarrollo
+            ai_provider=_env(
+                'AI_PROVIDER', 'mock' if is_development else 'openai'),
+            ai_provider_chain=_env('AI_PROVIDER_CHAIN', (), _parse_list),
+            ai_provider_hedge_seconds=_env(
+                'AI_PROVIDER_HEDGE_SECONDS', 1.5, float),
+            bedrock_region=_env('BEDROCK_REGION', 'us-east-1'),
+            bedrock_model_id=_env(
+                'BEDROCK_MODEL_ID',
+                'anthropic.claude-3-haiku-20240307-v1:0'
+            ),
+            bedrock_max_tokens=_env('BEDROCK_MAX_TOKENS', 1000, int),
+            bedrock_temperature=_env('BEDROCK_TEMPERATURE', 0.3, float),
+            bedrock_latency_optimized=_env(
+                'BEDROCK_LATENCY_OPTIMIZED', True, _parse_bool),
+            openai_api_key=_env('OPENAI_API_KEY', None),
+            openai_model=_env('OPENAI_MODEL', 'gpt-4o-mini'),
+            openai_max_tokens=_env('OPENAI_MAX_TOKENS', 350, int),
+            openai_temperature=_env('OPENAI_TEMPERATURE', 0.2, float),
+            # Si no se proporcionan, se usara IAM Role (self-hosted Lambda)
+            ext_aws_access_key_id=_env('EXT_AWS_ACCESS_KEY_ID', None),
+            ext_aws_secret_access_key=_env('EXT_AWS_SECRET_ACCESS_KEY', None),
+            aws_region=_env('AWS_REGION', 'us-east-1'),
+            dynamodb_table_name=_env('DYNAMODB_TABLE', 'DoctorErrores_Users'),
+            dynamodb_endpoint=_env('DYNAMODB_ENDPOINT', None),
+            enable_storage=_env('ENABLE_STORAGE', True, _parse_bool),
+            max_voice_length=_env('MAX_VOICE_LENGTH', 300, int),
+            max_card_length=_env('MAX_CARD_LENGTH', 1000, int),
+            max_card_content_length=_env('MAX_CARD_CONTENT_LENGTH', 8000, int),
+            # sha256 mantiene las claves CACHE#<hash> ya guardadas en
+            # DynamoDB; blake2b invalida el cache de IA existente
+            cache_hash_algo=_env('CACHE_HASH_ALGO', 'sha256', str.lower),
+        )
+
+
+# Constantes del modulo resueltas de forma lazy desde Settings (PEP 562)
+_LAZY_SETTINGS = {
+    **{field.name.upper(): field.name for field in fields(Settings)},
+    'IS_PRODUCTION': 'is_production',
+    'IS_DEVELOPMENT': 'is_development',
+    'MAX_VOICE_TEXT_LENGTH': 'max_voice_length',
+    'MAX_CARD_TEXT_LENGTH': 'max_card_length',
+}
+
+
+# Variable de entorno de cada campo de Settings
+_ENV_VARS = {
+    **{field.name: field.name.upper() for field in fields(Settings)},
+    'dynamodb_table_name': 'DYNAMODB_TABLE',
+}
+
+# Campos que nunca se escriben en el snapshot: se leen siempre del entorno
+_SECRET_FIELDS = frozenset({
+    'openai_api_key',
+    'ext_aws_access_key_id',
+    'ext_aws_secret_access_key',
+})
+
+
+def _read_secrets() -> Dict[str, Optional[str]]:
+    """
+    Lee los secretos del entorno (cargando .env si falta alguno).
 
-# ============================================================================
-# CONFIGURACION DE DESARROLLO
-# ============================================================================
+    Returns:
+        Diccionario campo -> valor de cada secreto
+    """
+    if any(_ENV_VARS[name] not in os.environ for name in _SECRET_FIELDS):
+        _load_dotenv()
 
-if IS_DEVELOPMENT:
-    # En desarrollo, usar logs mas verbosos
-    LOG_LEVEL = 'DEBUG'
+    return {name: _env(_ENV_VARS[name], None) for name in _SECRET_FIELDS}
 
-    # Usar mock AI por defecto en desarrollo
-    AI_PROVIDER = os.getenv('AI_PROVIDER', 'mock')
+
+def _load_frozen_settings() -> Optional[Settings]:
+    """
+    Carga el snapshot de configuracion generado en build/deploy.
+
+    El snapshot (config/_settings_frozen.py) lo genera
+    ``python -m config.freeze_settings`` y contiene los valores ya
+    resueltos como literales, por lo que Python lo sirve desde su .pyc
+    sin parsear .env ni hacer casts. Los secretos no estan en el snapshot
+    y se leen del entorno.
+
+    Returns:
+        Settings congelado, o None si no hay snapshot, si esta desactualizado
+        o si alguna variable de entorno cambio desde que se genero
+    """
+    try:
+        from config import _settings_frozen
+    except ImportError:
+        return None
+
+    # Variables de entorno (crudas) con las que se genero el snapshot
+    source_env = getattr(_settings_frozen, 'SOURCE_ENV', None)
+    if source_env is None:
+        return None
+
+    for name, env_var in _ENV_VARS.items():
+        if name in _SECRET_FIELDS:
+            continue
+        raw = os.environ.get(env_var)
+        if raw is not None and raw != source_env.get(env_var):
+            return None
+
+    values = {
+        name: getattr(_settings_frozen, name.upper())
+        for name in _ENV_VARS
+        if name not in _SECRET_FIELDS
+        and hasattr(_settings_frozen, name.upper())
+    }
+
+    try:
+        return Settings(**values, **_read_secrets())
+    except TypeError:
+        # Snapshot generado con otra version de Settings
+        return None
+
+
+def _load_dotenv() -> None:
+    """Carga variables de entorno desde .env (mejor esfuerzo)."""
+    try:
+        from dotenv import load_dotenv
+
+        # Buscar .env en el directorio lambda/
+        env_path = Path(__file__).parent.parent / '.env'
+        if env_path.exists():
+            load_dotenv(dotenv_path=env_path)
+            logger.debug("Variables de entorno cargadas desde: %s", env_path)
+        else:
+            logger.debug(
+                "Archivo .env no encontrado en: %s. Usando variables de "
+                "entorno del sistema o valores por defecto", env_path)
+    except ImportError:
+        logger.debug(
+            "python-dotenv no instalado. Usando variables de entorno del sistema.")
+    except Exception as e:
+        logger.warning("Error cargando .env: %s", e)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Obtiene la configuracion de la aplicacion (singleton lazy).
+
+    La primera llamada usa el snapshot congelado si existe y sigue
+    vigente; si no, carga .env y lee el entorno. En ambos casos valida.
+    Las siguientes llamadas reutilizan la misma instancia.
+
+    Con SKIP_CONFIG_VALIDATION=1 no se valida en runtime; la validacion
+    queda a cargo del build (`python -m config.validate`).
+
+    Returns:
+        Settings de la aplicacion
+
+    Raises:
+        ValueError: Si la configuracion es invalida
+    """
+    settings = _load_frozen_settings()
+    if settings is None:
+        _load_dotenv()
+        settings = Settings.from_env()
+
+    if os.getenv('SKIP_CONFIG_VALIDATION') == '1':
+        return settings
+
+    errors = _collect_config_errors(settings)
+    if errors:
+        raise ValueError("Configuracion invalida: " + "; ".join(errors))
+
+    return settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resuelve constantes de configuracion bajo demanda (PEP 562).
+
+    Mantiene compatibilidad con `from config.settings import NOMBRE`.
+    """
+    attribute = _LAZY_SETTINGS.get(name)
+    if attribute is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(get_settings(), attribute)
+
+
+# Una sola instancia del modulo por proceso: si este archivo se carga con
+# otro nombre (p.ej. 'settings' con lambda/config en sys.path), se comparte
+# el singleton del modulo canonico para no volver a parsear .env ni validar
+_CANONICAL_NAME = 'config.settings'
+
+if __name__ != _CANONICAL_NAME:
+    _canonical_module = sys.modules.get(_CANONICAL_NAME)
+    if _canonical_module is not None:
+        get_settings = _canonical_module.get_settings
+    else:
+        sys.modules[_CANONICAL_NAME] = sys.modules[__name__]
 
 
 # ============================================================================
 # VALIDACION DE CONFIGURACION
 # ============================================================================
 
-def validate_config() -> bool:
+def _collect_config_errors(settings: Settings) -> List[str]:
     """
-    Valida que la configuracion sea correcta.
+    Obtiene los errores de una configuracion.
+
+    Args:
+        settings: Configuracion a revisar
 
     Returns:
-        True si la configuracion es valida
+        Lista de mensajes de error (vacia si la configuracion es valida)
     """
     errors = []
 
     # Validar AI provider
-    if AI_PROVIDER not in [provider.value for provider in AIProvider]:
-        errors.append(f"AI_PROVIDER invalido: {AI_PROVIDER}")
-
-    # Validar que KB templates existe
-    if not os.path.exists(KB_TEMPLATES_PATH):
-        errors.append(f"KB templates no encontrado: {KB_TEMPLATES_PATH}")
+    if settings.ai_provider not in AI_PROVIDERS:
+        errors.append(f"AI_PROVIDER invalido: {settings.ai_provider}")
 
     # Validar OpenAI si esta configurado
-    if AI_PROVIDER == 'openai' and not OPENAI_API_KEY:
+    if settings.ai_provider == 'openai' and not settings.openai_api_key:
         errors.append("OPENAI_API_KEY requerido cuando AI_PROVIDER=openai")
 
+    for spec in settings.ai_provider_chain:
+        if spec.split(':', 1)[0] not in AI_PROVIDERS:
+            errors.append(f"AI_PROVIDER_CHAIN invalido: {spec}")
+
+    if settings.cache_hash_algo not in _CACHE_HASH_ALGOS:
+        errors.append(f"CACHE_HASH_ALGO invalido: {settings.cache_hash_algo}")
+
+    return errors
+
+
+def validate_config(settings: Optional[Settings] = None) -> bool:
+    """
+    Valida que la configuracion sea correcta.
+
+    Args:
+        settings: Configuracion a validar (default: get_settings())
+
+    Returns:
+        True si la configuracion es valida
+    """
+    if settings is None:
+        settings = get_settings()
+
+    errors = _collect_config_errors(settings)
     if errors:
-        print("Errores de configuracion:")
-        for error in errors:
-            print(f"  - {error}")
+        logger.error("Errores de configuracion: %s", "; ".join(errors))
         return False
 
     return True
@@ -174,21 +436,29 @@ def get_config_summary() -> dict:
     Returns:
         Diccionario con configuracion actual
     """
+    settings = get_settings()
+    is_openai = settings.ai_provider == 'openai'
+
     return {
-        'environment': ENVIRONMENT,
-        'log_level': LOG_LEVEL,
-        'ai_provider': AI_PROVIDER,
-        'kb_confidence_threshold': KB_CONFIDENCE_THRESHOLD,
-        'storage_enabled': ENABLE_STORAGE,
-        'openai_model': OPENAI_MODEL if AI_PROVIDER == 'openai' else None,
-        'openai_max_tokens': OPENAI_MAX_TOKENS if AI_PROVIDER == 'openai' else None,
-        'bedrock_model': BEDROCK_MODEL_ID if AI_PROVIDER == 'bedrock' else None,
-        'dynamodb_table': DYNAMODB_TABLE_NAME if ENABLE_STORAGE else None,
+        'environment': settings.environment,
+        'log_level': settings.log_level,
+        'ai_provider': settings.ai_provider,
+        'kb_confidence_threshold': settings.kb_confidence_threshold,
+        'storage_enabled': settings.enable_storage,
+        'openai_model': settings.openai_model if is_openai else None,
+        'openai_max_tokens': settings.openai_max_tokens if is_openai else None,
+        'bedrock_model': (
+            settings.bedrock_model_id
+            if settings.ai_provider == 'bedrock' else None
+        ),
+        'dynamodb_table': (
+            settings.dynamodb_table_name if settings.enable_storage else None
+        ),
     }
 
 
 def print_config():
-    """Imprime configuracion actual."""
+    """Imprime configuracion actual (helper manual, nunca al importar)."""
     print("="*60)
     print("CONFIGURACION - DOCTOR DE ERRORES")
     print("="*60)
@@ -198,8 +468,3 @@ def print_config():
         print(f"  {key}: {value}")
 
     print("="*60)
-
-
-# Validar configuracion al importar
-if not validate_config():
-    raise ValueError("Configuracion invalida. Revisa los errores arriba.")
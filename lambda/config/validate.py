@@ -0,0 +1,44 @@
+"""
+Valida la configuracion en build/CI, antes de desplegar.
+
+Se ejecuta desde el directorio lambda/:
+
+    python -m config.validate
+
+Resuelve Settings con el .env y las variables de entorno actuales (nunca
+desde el snapshot de config.freeze_settings) y termina con codigo 1 si la
+configuracion es invalida, para que el build falle antes de llegar a
+produccion. Con la validacion cubierta aqui, el runtime puede omitirla con
+SKIP_CONFIG_VALIDATION=1.
+"""
+
+import os
+import sys
+
+
+def main() -> int:
+    """
+    Valida la configuracion actual.
+
+    Returns:
+        Codigo de salida (0 si es valida, 1 si no)
+    """
+    from config.settings import (
+        Settings, _collect_config_errors, _load_dotenv
+    )
+
+    # Validar el entorno real: get_settings() usaria el snapshot congelado
+    # y omitiria la validacion con SKIP_CONFIG_VALIDATION=1
+    _load_dotenv()
+    errors = _collect_config_errors(Settings.from_env())
+    if errors:
+        print("Configuracion invalida: " + "; ".join(errors), file=sys.stderr)
+        return 1
+
+    print("Configuracion valida")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    sys.exit(main())
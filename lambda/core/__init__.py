@@ -9,44 +9,67 @@ Este paquete contiene:
 - Strategies para diagnosticos
 """
 
-from .factories import (
-    DiagnosticFactory,
-    UserProfileFactory,
-    ResponseFactory,
-    SessionStateFactory
-)
-
-from .response_builder import (
-    AlexaResponseBuilder,
-    DiagnosticResponseBuilder,
-    ProfileResponseBuilder,
-    response_builder,
-    diagnostic_response,
-    profile_response
-)
-
-from .prototype import (
-    DiagnosticPrototype,
-    UserProfilePrototype,
-    PrototypeRegistry,
-    registry,
-    get_diagnostic_template,
-    get_profile_template
-)
-
-from .interceptors import (
-    RECOMMENDED_REQUEST_INTERCEPTORS,
-    RECOMMENDED_RESPONSE_INTERCEPTORS
-)
-
-from .diagnostic_strategies import (
-    DiagnosticStrategy,
-    KnowledgeBaseStrategy,
-    CachedAIDiagnosticStrategy,
-    LiveAIDiagnosticStrategy,
-    DiagnosticStrategyChain,
-    create_default_strategy_chain
-)
+from importlib import import_module
+
+# Import lazy de simbolos (PEP 562): `from core.factories import X` ya no
+# arrastra interceptors ni strategies (y con ellos ask_sdk y storage).
+# Cada simbolo se importa la primera vez que se accede y queda cacheado.
+_LAZY = {
+    # Factories
+    'DiagnosticFactory': '.factories',
+    'UserProfileFactory': '.factories',
+    'ResponseFactory': '.factories',
+    'SessionStateFactory': '.factories',
+
+    # Builders
+    'AlexaResponseBuilder': '.response_builder',
+    'DiagnosticResponseBuilder': '.response_builder',
+    'ProfileResponseBuilder': '.response_builder',
+    # Nota: una vez importado el submodulo, `core.response_builder` es el
+    # modulo; para la instancia usar `from core.response_builder import ...`
+    'response_builder': '.response_builder',
+    'diagnostic_response': '.response_builder',
+    'profile_response': '.response_builder',
+
+    # Prototype
+    'DiagnosticPrototype': '.prototype',
+    'UserProfilePrototype': '.prototype',
+    'PrototypeRegistry': '.prototype',
+    'registry': '.prototype',
+    'get_diagnostic_template': '.prototype',
+    'get_profile_template': '.prototype',
+
+    # Interceptors
+    'RECOMMENDED_REQUEST_INTERCEPTORS': '.interceptors',
+    'RECOMMENDED_RESPONSE_INTERCEPTORS': '.interceptors',
+
+    # Strategies
+    'DiagnosticStrategy': '.diagnostic_strategies',
+    'InProcessCacheStrategy': '.diagnostic_strategies',
+    'KnowledgeBaseStrategy': '.diagnostic_strategies',
+    'CachedAIDiagnosticStrategy': '.diagnostic_strategies',
+    'LiveAIDiagnosticStrategy': '.diagnostic_strategies',
+    'DiagnosticStrategyChain': '.diagnostic_strategies',
+    'create_default_strategy_chain': '.diagnostic_strategies',
+    'default_search_diagnostic': '.diagnostic_strategies',
+}
+
+
+def __getattr__(name):
+    """Importa bajo demanda los simbolos publicos del paquete."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Incluye los simbolos lazy en dir(core)."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Factories
@@ -77,9 +100,11 @@ __all__ = [
 
     # Strategies
     'DiagnosticStrategy',
+    'InProcessCacheStrategy',
     'KnowledgeBaseStrategy',
     'CachedAIDiagnosticStrategy',
     'LiveAIDiagnosticStrategy',
     'DiagnosticStrategyChain',
-    'create_default_strategy_chain'
+    'create_default_strategy_chain',
+    'default_search_diagnostic'
 ]
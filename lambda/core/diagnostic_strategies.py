@@ -9,16 +9,62 @@ Patterns:
 - Chain of Responsibility: Se pueden encadenar estrategias
 """
 
+import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import import_module
+from operator import methodcaller
+from typing import Callable, Optional, List, Tuple
 from models import Diagnostic, UserProfile
-from utils import get_logger
+from utils import get_logger, get_error_hash
 
 from config.settings import KB_CONFIDENCE_THRESHOLD
 
-from services.kb_service import kb_service
-from services.ai_client import ai_service
-from services.storage import storage_service, get_error_hash
+# Los servicios (KB, IA, storage) se importan bajo demanda dentro de cada
+# estrategia: importar este modulo no carga el JSON de la KB ni crea
+# clientes de DynamoDB/IA hasta que una estrategia realmente los usa
+
+class _LazyService:
+    """
+    Atributo de clase que importa un servicio en el primer acceso.
+
+    Al resolverse se reemplaza a si mismo en la clase por el servicio, asi
+    los accesos siguientes son un lookup normal de atributo de clase.
+    """
+
+    def __init__(self, module_name: str, attribute: str):
+        """
+        Args:
+            module_name: Modulo que define el servicio
+            attribute: Nombre del singleton dentro del modulo
+        """
+        self.module_name = module_name
+        self.attribute = attribute
+        self.name = attribute
+
+    def __set_name__(self, owner, name):
+        """Recuerda el nombre del atributo en la clase duena."""
+        self.name = name
+
+    def __get__(self, instance, owner):
+        """Importa el servicio y lo fija como atributo de clase."""
+        service = getattr(import_module(self.module_name), self.attribute)
+        setattr(owner, self.name, service)
+        return service
+
+
+# Frase introductoria del usuario antes del error ("tengo el error X",
+# "I got an error: X"). Solo se quita al inicio del texto: las palabras
+# dentro del error nunca se tocan
+_LEADING_FILLER_PATTERN = re.compile(
+    r"\s*(?:tengo|me\s+(?:sale|salio|aparece|da|dice)"
+    r"|i\s+(?:got|get|have|am\s+getting)|i'?m\s+getting)"
+    r"(?:\s+(?:el|un|una|este|the|an?|this))?"
+    r"(?:\s+error)?\s*[:,]?\s+",
+    re.IGNORECASE
+)
 
 
 class DiagnosticStrategy(ABC):
@@ -27,18 +73,36 @@ class DiagnosticStrategy(ABC):
 
     Cada estrategia implementa una forma diferente de obtener
     diagnosticos (KB local, cache, IA, etc.).
+
+    Las estrategias no tienen estado por instancia (`__slots__ = ()`):
+    logger, servicios y metadatos son atributos de clase compartidos.
     """
 
-    def __init__(self):
-        """Inicializa la estrategia."""
-        self.logger = get_logger(self.__class__.__name__)
-        self.storage_service = None  # Para estrategias que usen storage
+    __slots__ = ()
+
+    # Metadatos de la estrategia (cada subclase define los suyos)
+    NAME = "Strategy"
+    PRIORITY = 999
+
+    # Para estrategias que usen storage (las subclases lo resuelven lazy)
+    storage_service = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Asigna a cada subclase su logger y niveles habilitados."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
+
+        # Niveles habilitados, resueltos una vez (LOG_LEVEL no cambia en
+        # runtime): evita formatear mensajes y crear dicts de `extra`
+        cls._debug = cls.logger.isEnabledFor(logging.DEBUG)
+        cls._info = cls.logger.isEnabledFor(logging.INFO)
 
     @abstractmethod
     def search_diagnostic(
         self,
         error_text: str,
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
     ) -> Optional[Diagnostic]:
         """
         Busca un diagnostico usando esta estrategia.
@@ -46,12 +110,24 @@ class DiagnosticStrategy(ABC):
         Args:
             error_text: Texto del error a diagnosticar
             user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado por la cadena (opcional)
 
         Returns:
             Diagnostic si se encuentra, None si no
         """
 
-    @abstractmethod
+    def warmup(self) -> None:
+        """
+        Resuelve los servicios lazy de la estrategia (KB, storage, IA).
+
+        Pensado para la fase de init de Lambda: el primer request no paga
+        la carga de la KB ni la creacion de clientes.
+        """
+        for klass in type(self).__mro__:
+            for name, value in list(vars(klass).items()):
+                if isinstance(value, _LazyService):
+                    getattr(self, name)
+
     def get_priority(self) -> int:
         """
         Obtiene la prioridad de esta estrategia.
@@ -59,10 +135,10 @@ class DiagnosticStrategy(ABC):
         Menor numero = mayor prioridad.
 
         Returns:
-            Prioridad (1 = maxima, 999 = minima)
+            Prioridad (0 = maxima, 999 = minima)
         """
+        return self.PRIORITY
 
-    @abstractmethod
     def get_name(self) -> str:
         """
         Obtiene el nombre de esta estrategia.
@@ -70,6 +146,126 @@ class DiagnosticStrategy(ABC):
         Returns:
             Nombre legible de la estrategia
         """
+        return self.NAME
+
+
+class InProcessCacheStrategy(DiagnosticStrategy):
+    """
+    Estrategia de busqueda en cache LRU en memoria del contenedor.
+
+    Prioridad: 0 (antes que cualquier otra)
+    Ventajas: Microsegundos, sin red, reutiliza entre invocaciones warm
+    Desventajas: Se pierde en cada cold start, no se comparte entre contenedores
+
+    El cache es compartido por todas las instancias (nivel de clase), asi
+    sobrevive a las cadenas creadas por cada handler.
+    """
+
+    __slots__ = ()
+
+    NAME = "In-Process Cache"
+    PRIORITY = 0  # No sale del proceso
+
+    MAX_ENTRIES = 512
+
+    _cache: 'OrderedDict[Tuple[str, str], Diagnostic]' = OrderedDict()
+
+    @staticmethod
+    def _build_key(
+        error_text: str,
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Construye la clave de cache (hash del error, contexto del perfil).
+
+        Si el texto empieza con una frase introductoria ("tengo el error",
+        "I got"), el hash se calcula sin ella: asi "tengo el error X" y "X"
+        comparten entrada sin llamar de nuevo a la IA. El resto del texto
+        se normaliza como en get_error_hash (respeta el orden y todas las
+        palabras del error).
+
+        Args:
+            error_text: Texto del error
+            user_profile: Perfil del usuario
+            error_hash: Hash del error completo precalculado (opcional)
+
+        Returns:
+            Tupla (hash del error, "os:pm")
+        """
+        match = _LEADING_FILLER_PATTERN.match(error_text)
+        if match and error_text[match.end():].strip():
+            error_hash = get_error_hash(error_text[match.end():])
+        return error_hash or get_error_hash(error_text), user_profile.cache_key
+
+    @classmethod
+    def store(
+        cls,
+        error_text: str,
+        diagnostic: Diagnostic,
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
+    ) -> None:
+        """
+        Guarda un diagnostico en el cache en memoria.
+
+        NO cachea diagnosticos de error (confidence=0 o source=unknown),
+        con la misma regla que el cache de DynamoDB.
+
+        Args:
+            error_text: Texto del error
+            diagnostic: Diagnostico a cachear
+            user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado (opcional)
+        """
+        if diagnostic.confidence == 0.0 or diagnostic.source == 'unknown':
+            return
+
+        key = cls._build_key(error_text, user_profile, error_hash)
+        cls._cache[key] = diagnostic
+        cls._cache.move_to_end(key)
+
+        if len(cls._cache) > cls.MAX_ENTRIES:
+            cls._cache.popitem(last=False)
+
+    def search_diagnostic(
+        self,
+        error_text: str,
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
+    ) -> Optional[Diagnostic]:
+        """
+        Busca en el cache en memoria.
+
+        Args:
+            error_text: Texto del error
+            user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado (opcional)
+
+        Returns:
+            Diagnostic cacheado si existe, None si no
+        """
+        try:
+            key = self._build_key(error_text, user_profile, error_hash)
+            diagnostic = self._cache.get(key)
+
+            if diagnostic is None:
+                if self._debug:
+                    self.logger.debug("In-process cache MISS")
+                return None
+
+            self._cache.move_to_end(key)
+            if self._info:
+                self.logger.info(
+                    "In-process cache HIT: %s", diagnostic.error_type,
+                    extra={'error_hash': key[0][:16]}
+                )
+            return diagnostic
+
+        except Exception as e:
+            self.logger.error(
+                f"In-process cache search failed: {e}", exc_info=True)
+            return None
 
 
 class KnowledgeBaseStrategy(DiagnosticStrategy):
@@ -81,16 +277,19 @@ class KnowledgeBaseStrategy(DiagnosticStrategy):
     Desventajas: Limitado a errores conocidos
     """
 
-    def __init__(self):
-        """Inicializa con referencia al servicio KB."""
-        super().__init__()
-        self.kb_service = kb_service
-        self.confidence_threshold = KB_CONFIDENCE_THRESHOLD
+    __slots__ = ()
+
+    NAME = "Knowledge Base"
+    PRIORITY = 1
+
+    confidence_threshold = KB_CONFIDENCE_THRESHOLD
+    kb_service = _LazyService('services.kb_service', 'kb_service')
 
     def search_diagnostic(
         self,
         error_text: str,
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
     ) -> Optional[Diagnostic]:
         """
         Busca en Knowledge Base local.
@@ -98,12 +297,14 @@ class KnowledgeBaseStrategy(DiagnosticStrategy):
         Args:
             error_text: Texto del error
             user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado (opcional)
 
         Returns:
             Diagnostic si confianza >= umbral, None si no
         """
         try:
-            self.logger.debug(f"Searching KB for: {error_text[:30]}...")
+            if self._debug:
+                self.logger.debug("Searching KB for: %s...", error_text[:30])
 
             diagnostic = self.kb_service.search_diagnostic(
                 error_text,
@@ -111,33 +312,27 @@ class KnowledgeBaseStrategy(DiagnosticStrategy):
             )
 
             if diagnostic and diagnostic.confidence >= self.confidence_threshold:
-                self.logger.info(
-                    f"KB match found: {diagnostic.error_type}",
-                    extra={'confidence': diagnostic.confidence}
-                )
+                if self._info:
+                    self.logger.info(
+                        "KB match found: %s", diagnostic.error_type,
+                        extra={'confidence': diagnostic.confidence}
+                    )
                 return diagnostic
 
-            self.logger.debug(
-                "KB confidence too low or no match",
-                extra={
-                    'confidence': diagnostic.confidence if diagnostic else 0,
-                    'threshold': self.confidence_threshold
-                }
-            )
+            if self._debug:
+                self.logger.debug(
+                    "KB confidence too low or no match",
+                    extra={
+                        'confidence': diagnostic.confidence if diagnostic else 0,
+                        'threshold': self.confidence_threshold
+                    }
+                )
             return None
 
         except Exception as e:
             self.logger.error(f"KB search failed: {e}", exc_info=True)
             return None
 
-    def get_priority(self) -> int:
-        """Maxima prioridad."""
-        return 1
-
-    def get_name(self) -> str:
-        """Nombre de la estrategia."""
-        return "Knowledge Base"
-
 
 class CachedAIDiagnosticStrategy(DiagnosticStrategy):
     """
@@ -148,15 +343,18 @@ class CachedAIDiagnosticStrategy(DiagnosticStrategy):
     Desventajas: Solo funciona si alguien ya pidio el mismo error
     """
 
-    def __init__(self):
-        """Inicializa con referencia al servicio de storage."""
-        super().__init__()
-        self.storage_service = storage_service
+    __slots__ = ()
+
+    NAME = "AI Cache"
+    PRIORITY = 2
+
+    storage_service = _LazyService('services.storage', 'storage_service')
 
     def search_diagnostic(
         self,
         error_text: str,
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
     ) -> Optional[Diagnostic]:
         """
         Busca en cache de diagnosticos de IA.
@@ -164,16 +362,17 @@ class CachedAIDiagnosticStrategy(DiagnosticStrategy):
         Args:
             error_text: Texto del error
             user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado (opcional)
 
         Returns:
             Diagnostic cacheado si existe y es compatible, None si no
         """
         try:
-            error_hash = get_error_hash(error_text)
+            error_hash = error_hash or get_error_hash(error_text)
 
-            self.logger.info(
-                f"Searching cache for hash: {error_hash[:16]}..."
-            )
+            if self._info:
+                self.logger.info(
+                    "Searching cache for hash: %s...", error_hash[:16])
 
             diagnostic = self.storage_service.get_ai_diagnostic_cache(
                 error_hash,
@@ -188,27 +387,23 @@ class CachedAIDiagnosticStrategy(DiagnosticStrategy):
                     )
                     return None
 
-                self.logger.info(
-                    f"Cache HIT: {diagnostic.error_type}",
-                    extra={'error_hash': error_hash[:16]}
-                )
+                if self._info:
+                    self.logger.info(
+                        "Cache HIT: %s", diagnostic.error_type,
+                        extra={'error_hash': error_hash[:16]}
+                    )
+                InProcessCacheStrategy.store(
+                    error_text, diagnostic, user_profile, error_hash)
                 return diagnostic
 
-            self.logger.debug("Cache MISS")
+            if self._debug:
+                self.logger.debug("Cache MISS")
             return None
 
         except Exception as e:
             self.logger.error(f"Cache search failed: {e}", exc_info=True)
             return None
 
-    def get_priority(self) -> int:
-        """Segunda prioridad."""
-        return 2
-
-    def get_name(self) -> str:
-        """Nombre de la estrategia."""
-        return "AI Cache"
-
 
 class LiveAIDiagnosticStrategy(DiagnosticStrategy):
     """
@@ -221,16 +416,24 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
     Esta estrategia tambien guarda el resultado en cache para futuros usos.
     """
 
-    def __init__(self):
-        """Inicializa con referencia a servicios de IA y storage."""
-        super().__init__()
-        self.ai_service = ai_service
-        self.storage_service = storage_service
+    __slots__ = ()
+
+    NAME = "Live AI"
+    PRIORITY = 3  # Mas costoso
+
+    ai_service = _LazyService('services.ai_client', 'ai_service')
+    storage_service = _LazyService('services.storage', 'storage_service')
+
+    def warmup(self) -> None:
+        """Ademas crea el AIService y los clientes de sus providers."""
+        super().warmup()
+        self.ai_service.get_available_providers()
 
     def search_diagnostic(
         self,
         error_text: str,
-        user_profile: UserProfile
+        user_profile: UserProfile,
+        error_hash: Optional[str] = None
     ) -> Optional[Diagnostic]:
         """
         Consulta IA en vivo y cachea el resultado.
@@ -238,6 +441,7 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
         Args:
             error_text: Texto del error
             user_profile: Perfil del usuario
+            error_hash: Hash del error precalculado (opcional)
 
         Returns:
             Diagnostic generado por IA
@@ -251,13 +455,17 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
             )
 
             if diagnostic:
-                self.logger.info(
-                    f"AI diagnostic generated: {diagnostic.error_type}",
-                    extra={'source': diagnostic.source}
-                )
+                if self._info:
+                    self.logger.info(
+                        "AI diagnostic generated: %s", diagnostic.error_type,
+                        extra={'source': diagnostic.source}
+                    )
 
                 # Guardar en cache para futuros usos
-                self._cache_diagnostic(error_text, diagnostic, user_profile)
+                error_hash = error_hash or get_error_hash(error_text)
+                InProcessCacheStrategy.store(
+                    error_text, diagnostic, user_profile, error_hash)
+                self._cache_diagnostic(error_hash, diagnostic, user_profile)
 
                 return diagnostic
 
@@ -270,7 +478,7 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
 
     def _cache_diagnostic(
         self,
-        error_text: str,
+        error_hash: str,
         diagnostic: Diagnostic,
         user_profile: UserProfile
     ) -> None:
@@ -281,7 +489,7 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
         para evitar que errores temporales se perpetuen en cache.
 
         Args:
-            error_text: Texto del error
+            error_hash: Hash del error
             diagnostic: Diagnostico a cachear
             user_profile: Perfil del usuario
         """
@@ -292,8 +500,6 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
                 )
                 return
 
-            error_hash = get_error_hash(error_text)
-
             success = self.storage_service.save_ai_diagnostic_cache(
                 error_hash,
                 diagnostic,
@@ -301,10 +507,11 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
             )
 
             if success:
-                self.logger.info(
-                    "Diagnostic cached for future use",
-                    extra={'error_hash': error_hash[:16]}
-                )
+                if self._info:
+                    self.logger.info(
+                        "Diagnostic cached for future use",
+                        extra={'error_hash': error_hash[:16]}
+                    )
             else:
                 self.logger.warning(
                     "Failed to cache diagnostic (DynamoDB unavailable)")
@@ -313,14 +520,6 @@ class LiveAIDiagnosticStrategy(DiagnosticStrategy):
             self.logger.error(
                 f"Failed to cache diagnostic: {e}", exc_info=True)
 
-    def get_priority(self) -> int:
-        """Minima prioridad (mas costoso)."""
-        return 3
-
-    def get_name(self) -> str:
-        """Nombre de la estrategia."""
-        return "Live AI"
-
 
 class DiagnosticStrategyChain:
     """
@@ -329,17 +528,35 @@ class DiagnosticStrategyChain:
     Ejecuta cada estrategia hasta que una retorne un diagnostico valido.
     """
 
-    def __init__(self, strategies: List[DiagnosticStrategy]):
+    def __init__(
+        self,
+        strategies: List[DiagnosticStrategy],
+        _pre_sorted: bool = False
+    ):
         """
         Inicializa la cadena con estrategias.
 
         Args:
             strategies: Lista de estrategias a ejecutar
+            _pre_sorted: True si `strategies` ya viene ordenada por prioridad
         """
         self.logger = get_logger(self.__class__.__name__)
 
         # Ordenar por prioridad (menor numero = mayor prioridad)
-        self.strategies = sorted(strategies, key=lambda s: s.get_priority())
+        self.strategies = list(strategies)
+        if not _pre_sorted:
+            self.strategies.sort(key=methodcaller('get_priority'))
+
+        # Precomputar (nombre, prioridad, search) una sola vez: el loop
+        # caliente desempaqueta tuplas en lugar de resolver atributos
+        self._precomputed: Tuple[
+            Tuple[str, int, Callable[..., Optional[Diagnostic]]], ...
+        ] = tuple(
+            (s.get_name(), s.get_priority(), s.search_diagnostic)
+            for s in self.strategies
+        )
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._info = self.logger.isEnabledFor(logging.INFO)
 
         self.logger.info(
             f"Strategy chain initialized with {len(self.strategies)} strategies",
@@ -348,6 +565,20 @@ class DiagnosticStrategyChain:
             }
         )
 
+    def warmup(self) -> None:
+        """
+        Precarga los servicios de todas las estrategias (mejor esfuerzo).
+
+        Un fallo aqui no impide el init: la estrategia volvera a intentar
+        resolver sus servicios en el primer request.
+        """
+        for strategy in self.strategies:
+            try:
+                strategy.warmup()
+            except Exception as e:
+                self.logger.warning(
+                    f"Warmup failed for {strategy.get_name()}: {e}")
+
     def search_diagnostic(
         self,
         error_text: str,
@@ -363,39 +594,50 @@ class DiagnosticStrategyChain:
         Returns:
             Diagnostic de la primera estrategia exitosa, None si todas fallan
         """
-        self.logger.info(
-            f"Starting strategy chain for error: {error_text[:30]}..."
-        )
+        if self._info:
+            self.logger.info(
+                "Starting strategy chain for error: %s...", error_text[:30])
 
-        for strategy in self.strategies:
-            self.logger.debug(
-                f"Trying strategy: {strategy.get_name()} "
-                f"(priority: {strategy.get_priority()})"
-            )
+        debug = self._debug
+
+        # Un solo hash por request, compartido por todas las estrategias
+        error_hash = get_error_hash(error_text)
+
+        for name, priority, search in self._precomputed:
+            if debug:
+                self.logger.debug(
+                    "Trying strategy: %s (priority: %d)", name, priority)
 
-            diagnostic = strategy.search_diagnostic(error_text, user_profile)
+            diagnostic = search(error_text, user_profile, error_hash)
 
             if diagnostic:
-                self.logger.info(
-                    f"Strategy SUCCESS: {strategy.get_name()}",
-                    extra={
-                        'error_type': diagnostic.error_type,
-                        'confidence': diagnostic.confidence
-                    }
-                )
+                if self._info:
+                    self.logger.info(
+                        "Strategy SUCCESS: %s", name,
+                        extra={
+                            'error_type': diagnostic.error_type,
+                            'confidence': diagnostic.confidence
+                        }
+                    )
                 return diagnostic
 
-            self.logger.debug(f"Strategy {strategy.get_name()} returned None")
+            if debug:
+                self.logger.debug("Strategy %s returned None", name)
 
         self.logger.warning("All strategies failed to find diagnostic")
         return None
 
 
+@lru_cache(maxsize=1)
 def create_default_strategy_chain() -> DiagnosticStrategyChain:
     """
-    Crea la cadena de estrategias por defecto.
+    Crea la cadena de estrategias por defecto (una sola vez por proceso).
+
+    La cadena no tiene estado por request, asi que todos los handlers
+    comparten la misma instancia.
 
     Orden de ejecucion:
+    0. In-Process Cache (memoria del contenedor, sin red)
     1. Knowledge Base (rapido, gratis, preciso)
     2. AI Cache (rapido, gratis, reutiliza)
     3. Live AI (lento, costoso, flexible)
@@ -403,10 +645,33 @@ def create_default_strategy_chain() -> DiagnosticStrategyChain:
     Returns:
         DiagnosticStrategyChain configurada
     """
+    # Ya en orden de prioridad
     strategies = [
+        InProcessCacheStrategy(),
         KnowledgeBaseStrategy(),
         CachedAIDiagnosticStrategy(),
         LiveAIDiagnosticStrategy()
     ]
 
-    return DiagnosticStrategyChain(strategies)
+    return DiagnosticStrategyChain(strategies, _pre_sorted=True)
+
+
+def default_search_diagnostic(
+    error_text: str,
+    user_profile: UserProfile
+) -> Optional[Diagnostic]:
+    """
+    Busca un diagnostico con la cadena por defecto del proceso.
+
+    Atajo para flujos que solo necesitan el resultado sobre la cadena
+    compartida de create_default_strategy_chain().
+
+    Args:
+        error_text: Texto del error
+        user_profile: Perfil del usuario
+
+    Returns:
+        Diagnostic de la primera estrategia exitosa, None si todas fallan
+    """
+    return create_default_strategy_chain().search_diagnostic(
+        error_text, user_profile)
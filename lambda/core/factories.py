@@ -9,19 +9,95 @@ Patterns:
 - Builder: Construccion paso a paso de objetos
 """
 
+import re
+import time
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 
 from models import (
     Diagnostic,
     UserProfile,
     DiagnosticSource,
     OperatingSystem,
-    PackageManager
+    PackageManager,
+    intern_label
 )
 from .solution_extractors import SolutionExtractionStrategy
 
 
+# Placeholders de perfil en soluciones ({pm}, {os}, {editor}); una sola
+# pasada por solucion. Otras llaves (p.ej. codigo con {}) no se tocan.
+_PLACEHOLDER_RE = re.compile(r'\{(pm|os|editor)\}')
+
+# Valores de DiagnosticSource resueltos una sola vez
+_SRC_KB = DiagnosticSource.KNOWLEDGE_BASE.value
+_SRC_AI = DiagnosticSource.AI_SERVICE.value
+_SRC_UNKNOWN = DiagnosticSource.UNKNOWN.value
+
+# Contenido fijo del diagnostico de error
+_ERROR_DIAGNOSTIC_VOICE = (
+    "Lo siento, tuve un problema al procesar tu solicitud. "
+    "Por favor intenta de nuevo."
+)
+_ERROR_DIAGNOSTIC_SOLUTIONS = (
+    "Intenta describir el error de otra manera",
+    "Verifica tu conexion a internet",
+    "Intenta mas tarde"
+)
+
+# Plantillas precalculadas de voz y card (no se rearman por diagnostico)
+_VOICE_NO_SOLUTIONS_TEMPLATE = (
+    "Detecte un error de tipo %s. No tengo soluciones especificas disponibles."
+)
+_VOICE_TEMPLATE = "Detecte un %s. Solucion: %s"
+_VOICE_WITH_MORE_TEMPLATE = (
+    "Detecte un %s. Solucion: %s Tengo %d soluciones mas disponibles."
+)
+
+_CARD_SOLUTIONS_TEMPLATE = "**Soluciones**:\n%s\n\n"
+_CARD_EXPLANATION_TEMPLATE = "**Explicacion**:\n%s\n\n"
+_CARD_FOOTER = (
+    "**Mas ayuda**:\n"
+    "- Di 'por que pasa esto' para entender la causa\n"
+    "- Di 'dame mas opciones' para ver otras soluciones\n"
+    "- Di 'envialo a mi telefono' para guardar esta informacion"
+)
+
+# Respuestas constantes de Alexa (armadas una sola vez al importar)
+_ERROR_SPEAK_TEMPLATE = "Lo siento, %s. ¿Puedes intentar de nuevo?"
+_CONFIRMATION_REPROMPT = "¿Necesitas algo mas?"
+
+_HELP_SPEAK = (
+    "Soy el Doctor de Errores, tu asistente para diagnosticar "
+    "problemas de programacion en Python. "
+    "Puedes decir: tengo un error module not found, "
+    "o describir cualquier error que tengas. "
+    "Tambien puedes configurar tu perfil diciendo: "
+    "uso Windows y pip. "
+    "¿Que error necesitas diagnosticar?"
+)
+_ERROR_REPROMPT = "¿Que error tienes?"
+
+_WELCOME_INTRO = (
+    "Bienvenido al Doctor de Errores. "
+    "Soy tu asistente para diagnosticar errores de Python. "
+)
+_WELCOME_SPEAK = _WELCOME_INTRO + "¿Que error estas teniendo?"
+_WELCOME_SETUP_SPEAK = _WELCOME_INTRO + (
+    "Antes de comenzar, puedes configurar tu perfil diciendo, "
+    "por ejemplo: uso Windows y pip. "
+    "O puedes ir directamente a describir el error que estas teniendo."
+)
+_WELCOME_SETUP_REPROMPT = (
+    "¿Que sistema operativo y gestor de paquetes usas, o que error tienes?"
+)
+
+_GOODBYE_SPEAK = (
+    "Hasta luego. "
+    "Espero haber sido de ayuda. "
+    "Vuelve cuando necesites diagnosticar otro error."
+)
+
+
 class DiagnosticFactory:
     """
     Factory para crear instancias de Diagnostic.
@@ -72,7 +148,8 @@ class DiagnosticFactory:
 
         voice_text = diagnosis.get('voice_text') or DiagnosticFactory._build_voice_text(
             error_type,
-            personalized_solutions
+            personalized_solutions,
+            skip_truncate=True
         )
         explanation = diagnosis.get('explanation', '')
 
@@ -94,7 +171,7 @@ class DiagnosticFactory:
             solutions=personalized_solutions,
             explanation=explanation,
             confidence=kb_result.get('confidence', 0.0),
-            source=DiagnosticSource.KNOWLEDGE_BASE.value,
+            source=_SRC_KB,
             common_causes=common_causes,
             related_errors=kb_result.get('related_errors', [])
         )
@@ -114,7 +191,7 @@ class DiagnosticFactory:
         Returns:
             Diagnostic completo
         """
-        error_type = ai_result.get('error_type', 'unknown')
+        error_type = intern_label(ai_result.get('error_type', 'unknown'))
         solutions = ai_result.get('solutions', [])
 
         # AI ya personaliza, pero validamos formato
@@ -148,7 +225,7 @@ class DiagnosticFactory:
             solutions=personalized_solutions,
             explanation=ai_result.get('explanation'),
             confidence=ai_result.get('confidence', 0.8),
-            source=DiagnosticSource.AI_SERVICE.value,
+            source=_SRC_AI,
             common_causes=ai_result.get('common_causes', []),
             related_errors=ai_result.get('related_errors', [])
         )
@@ -170,19 +247,13 @@ class DiagnosticFactory:
         """
         return Diagnostic(
             error_type=error_type,
-            voice_text=(
-                "Lo siento, tuve un problema al procesar tu solicitud. "
-                "Por favor intenta de nuevo."
-            ),
+            voice_text=_ERROR_DIAGNOSTIC_VOICE,
             card_title="Error",
             card_text=f"Error: {error_message}",
-            solutions=[
-                "Intenta describir el error de otra manera",
-                "Verifica tu conexion a internet",
-                "Intenta mas tarde"
-            ],
+            # Copia: cada Diagnostic es duenio de su lista de soluciones
+            solutions=list(_ERROR_DIAGNOSTIC_SOLUTIONS),
             confidence=0.0,
-            source=DiagnosticSource.UNKNOWN.value
+            source=_SRC_UNKNOWN
         )
 
     @staticmethod
@@ -203,57 +274,60 @@ class DiagnosticFactory:
         Returns:
             Lista de soluciones personalizadas
         """
-        personalized = []
-
-        pm_value = user_profile.package_manager.value if hasattr(
-            user_profile.package_manager, 'value') else str(user_profile.package_manager)
-        os_value = user_profile.os.value if hasattr(
-            user_profile.os, 'value') else str(user_profile.os)
-        editor_value = user_profile.editor.value if hasattr(
-            user_profile.editor, 'value') else str(user_profile.editor)
-
-        for solution in solutions:
-            # Reemplazar placeholders
-            personalized_solution = solution.replace(
-                '{pm}', pm_value
-            ).replace(
-                '{os}', os_value
-            ).replace(
-                '{editor}', editor_value
-            )
-            personalized.append(personalized_solution)
+        mapping = {
+            'pm': str(getattr(
+                user_profile.package_manager, 'value',
+                user_profile.package_manager)),
+            'os': str(getattr(user_profile.os, 'value', user_profile.os)),
+            'editor': str(getattr(
+                user_profile.editor, 'value', user_profile.editor)),
+        }
+
+        def replace(match):
+            return mapping[match.group(1)]
 
-        return personalized
+        # Reemplazar placeholders (sin regex si la solucion no tiene llaves)
+        return [
+            _PLACEHOLDER_RE.sub(replace, solution) if '{' in solution
+            else solution
+            for solution in solutions
+        ]
 
     @staticmethod
-    def _build_voice_text(error_type: str, solutions: List[str]) -> str:
+    def _build_voice_text(
+        error_type: str,
+        solutions: List[str],
+        skip_truncate: bool = False
+    ) -> str:
         """
         Construye el texto de voz simplificado.
 
         Args:
             error_type: Tipo de error
             solutions: Lista de soluciones
+            skip_truncate: Omitir el recorte de la primera solucion
+                (soluciones de la KB, curadas y cortas)
 
         Returns:
             Texto para voz (max 300 chars)
         """
         if not solutions:
-            return f"Detecte un error de tipo {error_type}. No tengo soluciones especificas disponibles."
+            return _VOICE_NO_SOLUTIONS_TEMPLATE % error_type
 
         # Primera solucion simplificada
         first_solution = solutions[0]
-        if len(first_solution) > 150:
-            first_solution = first_solution[:147] + "..."
+        if not skip_truncate:
+            first_solution = (
+                first_solution if len(first_solution) <= 150
+                else first_solution[:147] + "..."
+            )
 
         num_more = len(solutions) - 1
         if num_more > 0:
-            return (
-                f"Detecte un {error_type}. "
-                f"Solucion: {first_solution} "
-                f"Tengo {num_more} soluciones mas disponibles."
-            )
+            return _VOICE_WITH_MORE_TEMPLATE % (
+                error_type, first_solution, num_more)
 
-        return f"Detecte un {error_type}. Solucion: {first_solution}"
+        return _VOICE_TEMPLATE % (error_type, first_solution)
 
     @staticmethod
     def _build_card_title(error_type: str) -> str:
@@ -277,30 +351,19 @@ class DiagnosticFactory:
         Returns:
             Texto formateado para card
         """
-        lines = [
-            f"**Error**: {error_type}",
-            ""
-        ]
-
-        if solutions:
-            lines.append("**Soluciones**:")
-            for i, sol in enumerate(solutions, 1):
-                lines.append(f"{i}. {sol}")
-            lines.append("")
-
-        if explanation:
-            lines.append("**Explicacion**:")
-            lines.append(explanation)
-            lines.append("")
-
-        lines.extend([
-            "**Mas ayuda**:",
-            "- Di 'por que pasa esto' para entender la causa",
-            "- Di 'dame mas opciones' para ver otras soluciones",
-            "- Di 'envialo a mi telefono' para guardar esta informacion"
-        ])
+        solutions_block = (
+            _CARD_SOLUTIONS_TEMPLATE % "\n".join([
+                f"{i}. {sol}" for i, sol in enumerate(solutions, 1)])
+            if solutions else ""
+        )
+        explanation_block = (
+            _CARD_EXPLANATION_TEMPLATE % explanation if explanation else ""
+        )
 
-        return "\n".join(lines)
+        return (
+            f"**Error**: {error_type}\n\n"
+            f"{solutions_block}{explanation_block}{_CARD_FOOTER}"
+        )
 
 
 class UserProfileFactory:
@@ -429,10 +492,7 @@ class ResponseFactory:
         """
         builder = handler_input.response_builder
 
-        speak_output = (
-            f"Lo siento, {error_message}. "
-            "¿Puedes intentar de nuevo?"
-        )
+        speak_output = _ERROR_SPEAK_TEMPLATE % error_message
 
         if should_end_session:
             return builder.speak(speak_output).response
@@ -463,7 +523,7 @@ class ResponseFactory:
         if card_title and card_content:
             builder.set_card(title=card_title, content=card_content)
 
-        return builder.ask("¿Necesitas algo mas?").response
+        return builder.ask(_CONFIRMATION_REPROMPT).response
 
     @staticmethod
     def create_help_response(handler_input):
@@ -476,20 +536,10 @@ class ResponseFactory:
         Returns:
             Response de Alexa
         """
-        speak_output = (
-            "Soy el Doctor de Errores, tu asistente para diagnosticar "
-            "problemas de programacion en Python. "
-            "Puedes decir: tengo un error module not found, "
-            "o describir cualquier error que tengas. "
-            "Tambien puedes configurar tu perfil diciendo: "
-            "uso Windows y pip. "
-            "¿Que error necesitas diagnosticar?"
-        )
-
         return (
             handler_input.response_builder
-            .speak(speak_output)
-            .ask("¿Que error tienes?")
+            .speak(_HELP_SPEAK)
+            .ask(_ERROR_REPROMPT)
             .response
         )
 
@@ -517,22 +567,13 @@ class ResponseFactory:
             )
 
 
-        speak_output = (
-            "Bienvenido al Doctor de Errores. "
-            "Soy tu asistente para diagnosticar errores de Python. "
-        )
-
         # Si no tiene perfil configurado, sugerir configurarlo
         if not profile_configured:
-            speak_output += (
-                "Antes de comenzar, puedes configurar tu perfil diciendo, "
-                "por ejemplo: uso Windows y pip. "
-                "O puedes ir directamente a describir el error que estas teniendo."
-            )
-            reprompt = "¿Que sistema operativo y gestor de paquetes usas, o que error tienes?"
+            speak_output = _WELCOME_SETUP_SPEAK
+            reprompt = _WELCOME_SETUP_REPROMPT
         else:
-            speak_output += "¿Que error estas teniendo?"
-            reprompt = "¿Que error tienes?"
+            speak_output = _WELCOME_SPEAK
+            reprompt = _ERROR_REPROMPT
 
         return (
             handler_input.response_builder
@@ -552,13 +593,7 @@ class ResponseFactory:
         Returns:
             Response de Alexa
         """
-        speak_output = (
-            "Hasta luego. "
-            "Espero haber sido de ayuda. "
-            "Vuelve cuando necesites diagnosticar otro error."
-        )
-
-        return handler_input.response_builder.speak(speak_output).response
+        return handler_input.response_builder.speak(_GOODBYE_SPEAK).response
 
 
 class SessionStateFactory:
@@ -580,7 +615,8 @@ class SessionStateFactory:
             'user_profile': None,
             'last_diagnostic': None,
             'solution_index': 0,
-            'session_start': datetime.utcnow().isoformat()
+            # Epoch en segundos; se formatea solo si alguien lo persiste
+            'session_start': time.time()
         }
 
     @staticmethod
@@ -612,13 +648,15 @@ class SessionStateFactory:
         """
         Resetea el contexto de diagnostico manteniendo perfil.
 
+        Modifica session_attrs in-place: es el store mutable de la sesion
+        (attributes_manager.session_attributes), no hace falta copiarlo.
+
         Args:
             session_attrs: Atributos de sesion actuales
 
         Returns:
-            Atributos con diagnostico reseteado
+            El mismo dict, con el diagnostico reseteado
         """
-        new_attrs = session_attrs.copy()
-        new_attrs['last_diagnostic'] = None
-        new_attrs['solution_index'] = 0
-        return new_attrs
+        session_attrs['last_diagnostic'] = None
+        session_attrs['solution_index'] = 0
+        return session_attrs
@@ -10,9 +10,10 @@ Patterns:
 - Chain of Responsibility: Cadena de interceptores
 """
 
-from typing import Optional
+import hashlib
+import logging
+from typing import Any, Dict, Optional
 import time
-from datetime import datetime
 
 from ask_sdk_core.dispatch_components import (
     AbstractRequestInterceptor,
@@ -26,6 +27,29 @@ from services.storage import storage_service
 from models import UserProfile
 
 
+# Loggers compartidos a nivel de modulo: los interceptores no tienen estado
+_REQUEST_LOGGER = get_logger('interceptors.request')
+_RESPONSE_LOGGER = get_logger('interceptors.response')
+_METRICS_LOGGER = get_logger('interceptors.metrics')
+
+
+def _profile_hash(profile_dict: Dict[str, Any]) -> str:
+    """
+    Calcula un hash determinista del perfil guardado en sesion.
+
+    No se usa hash() porque esta aleatorizado por proceso y los
+    atributos de sesion viajan entre contenedores Lambda.
+
+    Args:
+        profile_dict: Perfil serializado (UserProfile.to_dict())
+
+    Returns:
+        Hash hexadecimal corto del perfil
+    """
+    payload = repr(tuple(sorted(profile_dict.items()))).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
 class LoggingRequestInterceptor(AbstractRequestInterceptor):
     """
     Interceptor que loguea todos los requests entrantes.
@@ -38,10 +62,6 @@ class LoggingRequestInterceptor(AbstractRequestInterceptor):
     - Locale
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(self, handler_input: HandlerInput) -> None:
         """
         Procesa el request antes de manejarlo.
@@ -66,21 +86,23 @@ class LoggingRequestInterceptor(AbstractRequestInterceptor):
 
         locale = request.locale if hasattr(request, 'locale') else 'unknown'
 
-        # Log estructurado
-        self.logger.info(
-            f"Incoming request: {request_type}",
-            extra={
-                'request_type': request_type,
-                'request_id': request_id,
-                'user_id': user_id,
-                'session_id': session_id,
-                'locale': locale,
-                'timestamp': datetime.utcnow().isoformat()
-            }
-        )
+        # Log estructurado (el dict de extra solo se arma si INFO esta activo)
+        if _REQUEST_LOGGER.isEnabledFor(logging.INFO):
+            _REQUEST_LOGGER.info(
+                "Incoming request: %s", request_type,
+                extra={
+                    'request_type': request_type,
+                    'request_id': request_id,
+                    'user_id': user_id,
+                    'session_id': session_id,
+                    'locale': locale
+                }
+            )
 
-        # Guardar timestamp para calcular duracion
-        handler_input.request_envelope.context.timestamp_start = time.time()
+        # Guardar timestamp para calcular duracion (request_attributes es
+        # un dict plano por request, sin lookups dinamicos sobre el modelo)
+        handler_input.attributes_manager.request_attributes[
+            'timestamp_start'] = time.time()
 
 
 class LoggingResponseInterceptor(AbstractResponseInterceptor):
@@ -90,10 +112,6 @@ class LoggingResponseInterceptor(AbstractResponseInterceptor):
     Registra informacion de la respuesta y metricas de performance.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(
         self,
         handler_input: HandlerInput,
@@ -111,8 +129,9 @@ class LoggingResponseInterceptor(AbstractResponseInterceptor):
 
         # Calcular duracion si timestamp_start existe
         duration_ms = None
-        if hasattr(handler_input.request_envelope.context, 'timestamp_start'):
-            start_time = handler_input.request_envelope.context.timestamp_start
+        start_time = handler_input.attributes_manager.request_attributes.get(
+            'timestamp_start')
+        if start_time is not None:
             duration_ms = (time.time() - start_time) * 1000
 
         # Extraer informacion de la respuesta
@@ -128,18 +147,18 @@ class LoggingResponseInterceptor(AbstractResponseInterceptor):
             if response.should_end_session is not None:
                 should_end_session = response.should_end_session
 
-        # Log estructurado
-        self.logger.info(
-            f"Outgoing response for: {request_type}",
-            extra={
-                'request_type': request_type,
-                'has_speech': has_speech,
-                'has_card': has_card,
-                'should_end_session': should_end_session,
-                'duration_ms': duration_ms,
-                'timestamp': datetime.utcnow().isoformat()
-            }
-        )
+        # Log estructurado (el dict de extra solo se arma si INFO esta activo)
+        if _RESPONSE_LOGGER.isEnabledFor(logging.INFO):
+            _RESPONSE_LOGGER.info(
+                "Outgoing response for: %s", request_type,
+                extra={
+                    'request_type': request_type,
+                    'has_speech': has_speech,
+                    'has_card': has_card,
+                    'should_end_session': should_end_session,
+                    'duration_ms': duration_ms
+                }
+            )
 
 
 class SessionAttributesInterceptor(AbstractRequestInterceptor):
@@ -149,10 +168,6 @@ class SessionAttributesInterceptor(AbstractRequestInterceptor):
     Util para debugging de estado de sesion.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(self, handler_input: HandlerInput) -> None:
         """
         Procesa atributos de sesion.
@@ -160,21 +175,24 @@ class SessionAttributesInterceptor(AbstractRequestInterceptor):
         Args:
             handler_input: Input del request
         """
+        # Solo loguea: sin DEBUG activo no hay nada que armar
+        if not _REQUEST_LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
         session_attrs = handler_input.attributes_manager.session_attributes
+        if not session_attrs:
+            return
 
-        if session_attrs:
-            # Loguear claves sin valores sensibles
-            attrs_summary = {
+        # Loguear claves sin valores sensibles
+        _REQUEST_LOGGER.debug(
+            "Session attributes",
+            extra={
                 'has_user_profile': 'user_profile' in session_attrs,
                 'has_last_diagnostic': 'last_diagnostic' in session_attrs,
                 'solution_index': session_attrs.get('solution_index', 0),
                 'num_attributes': len(session_attrs)
             }
-
-            self.logger.debug(
-                "Session attributes",
-                extra=attrs_summary
-            )
+        )
 
 
 class ErrorHandlingInterceptor(AbstractRequestInterceptor):
@@ -184,10 +202,6 @@ class ErrorHandlingInterceptor(AbstractRequestInterceptor):
     Configura contexto para captura de errores.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(self, handler_input: HandlerInput) -> None:
         """
         Inicializa contexto de error.
@@ -195,9 +209,9 @@ class ErrorHandlingInterceptor(AbstractRequestInterceptor):
         Args:
             handler_input: Input del request
         """
-        # Inicializar flag de error en contexto
-        if not hasattr(handler_input.request_envelope.context, 'error_occurred'):
-            handler_input.request_envelope.context.error_occurred = False
+        # Inicializar flag de error en los atributos del request
+        handler_input.attributes_manager.request_attributes.setdefault(
+            'error_occurred', False)
 
 
 class MetricsInterceptor(AbstractResponseInterceptor):
@@ -207,10 +221,6 @@ class MetricsInterceptor(AbstractResponseInterceptor):
     Registra metricas de uso para analytics.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(
         self,
         handler_input: HandlerInput,
@@ -223,36 +233,42 @@ class MetricsInterceptor(AbstractResponseInterceptor):
             handler_input: Input del request
             response: Response generada
         """
+        # Las metricas solo se publican via log: sin INFO no hay nada que armar
+        if not _METRICS_LOGGER.isEnabledFor(logging.INFO):
+            return
+
         request = handler_input.request_envelope.request
         request_type = request.object_type
 
-        # Metricas basicas
-        metrics = {
-            'request_type': request_type,
-            'locale': getattr(request, 'locale', 'unknown'),
-            'timestamp': datetime.utcnow().isoformat()
-        }
-
-        # Agregar metricas de intent si aplica
+        # Partes opcionales primero; el dict final se arma en un solo literal
+        intent_info = {}
         if request_type == 'IntentRequest':
-            intent_name = request.intent.name
-            metrics['intent_name'] = intent_name
+            intent = request.intent
+            intent_info['intent_name'] = intent.name
 
             # Contar slots proporcionados
-            if request.intent.slots:
-                filled_slots = sum(
-                    1 for slot in request.intent.slots.values()
+            if intent.slots:
+                intent_info['filled_slots'] = sum(
+                    1 for slot in intent.slots.values()
                     if slot.value is not None
                 )
-                metrics['filled_slots'] = filled_slots
 
-        # Agregar duracion si esta disponible
-        if hasattr(handler_input.request_envelope.context, 'timestamp_start'):
-            start_time = handler_input.request_envelope.context.timestamp_start
-            metrics['duration_ms'] = (time.time() - start_time) * 1000
+        start_time = handler_input.attributes_manager.request_attributes.get(
+            'timestamp_start')
+        duration_info = (
+            {'duration_ms': (time.time() - start_time) * 1000}
+            if start_time is not None else {}
+        )
+
+        metrics = {
+            'request_type': request_type,
+            'locale': getattr(request, 'locale', 'unknown'),
+            **intent_info,
+            **duration_info
+        }
 
         # Log de metricas (en produccion, enviar a servicio de metricas)
-        self.logger.info(
+        _METRICS_LOGGER.info(
             "Metrics collected",
             extra=metrics
         )
@@ -265,10 +281,6 @@ class UserContextInterceptor(AbstractRequestInterceptor):
     Carga perfil de usuario si existe y lo hace disponible.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(self, handler_input: HandlerInput) -> None:
         """
         Carga contexto de usuario.
@@ -280,7 +292,7 @@ class UserContextInterceptor(AbstractRequestInterceptor):
 
         # Verificar si ya existe perfil en sesion
         if 'user_profile' in session_attrs:
-            self.logger.debug("User profile found in session")
+            _REQUEST_LOGGER.debug("User profile found in session")
         else:
             # Cargar de DynamoDB si existe
             try:
@@ -288,19 +300,22 @@ class UserContextInterceptor(AbstractRequestInterceptor):
                 profile = storage_service.get_user_profile(user_id)
 
                 if profile:
-                    self.logger.info(
+                    _REQUEST_LOGGER.info(
                         "User profile loaded from DynamoDB",
                         extra={'user_id': user_id}
                     )
                     # Cachear en o
-                    session_attrs['user_profile'] = profile.to_dict()
+                    profile_dict = profile.to_dict()
+                    session_attrs['user_profile'] = profile_dict
+                    session_attrs['_profile_hash'] = _profile_hash(
+                        profile_dict)
                 else:
-                    self.logger.debug(
+                    _REQUEST_LOGGER.debug(
                         "No user profile in DynamoDB",
                         extra={'user_id': user_id}
                     )
             except Exception as e:
-                self.logger.warning(
+                _REQUEST_LOGGER.warning(
                     f"Failed to load user profile from DynamoDB: {e}",
                     exc_info=True
                 )
@@ -313,10 +328,6 @@ class LocalizationInterceptor(AbstractRequestInterceptor):
     Configura locale para respuestas internacionalizadas.
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(self, handler_input: HandlerInput) -> None:
         """
         Configura locale.
@@ -327,23 +338,20 @@ class LocalizationInterceptor(AbstractRequestInterceptor):
         request = handler_input.request_envelope.request
         locale = getattr(request, 'locale', 'es-MX')
 
-        # Guardar locale en contexto para uso posterior
-        handler_input.request_envelope.context.locale = locale
+        # Guardar locale en los atributos del request para uso posterior
+        handler_input.attributes_manager.request_attributes['locale'] = locale
 
-        self.logger.debug(f"Locale set to: {locale}")
+        _REQUEST_LOGGER.debug("Locale set to: %s", locale)
 
 
 class SessionPersistenceInterceptor(AbstractResponseInterceptor):
     """
     Interceptor que persiste atributos de sesion.
 
-    Guarda datos importantes en almacenamiento persistente.
+    Guarda datos importantes en almacenamiento persistente. El perfil
+    solo se escribe si cambio respecto al cargado (`_profile_hash`).
     """
 
-    def __init__(self):
-        """Inicializa el interceptor."""
-        self.logger = get_logger(self.__class__.__name__)
-
     def process(
         self,
         handler_input: HandlerInput,
@@ -360,48 +368,52 @@ class SessionPersistenceInterceptor(AbstractResponseInterceptor):
 
         # Si hay perfil de usuario y la o termina, persistir
         if 'user_profile' in session_attrs:
-            should_persist = (
+            profile_dict = session_attrs['user_profile']
+            new_hash = _profile_hash(profile_dict)
+
+            should_persist = session_attrs.get('profile_updated', False) or (
                 response and response.should_end_session
-            ) or session_attrs.get('profile_updated', False)
+                and new_hash != session_attrs.get('_profile_hash')
+            )
 
             if should_persist:
                 try:
                     user_id = handler_input.request_envelope.session.user.user_id
-                    profile_dict = session_attrs['user_profile']
                     profile = UserProfile.from_dict(profile_dict)
 
                     success = storage_service.save_user_profile(
                         user_id, profile)
 
                     if success:
-                        self.logger.info(
+                        _RESPONSE_LOGGER.info(
                             "User profile persisted to DynamoDB",
                             extra={'user_id': user_id}
                         )
                         session_attrs.pop('profile_updated', None)
+                        session_attrs['_profile_hash'] = new_hash
                     else:
-                        self.logger.warning(
+                        _RESPONSE_LOGGER.warning(
                             "DynamoDB not available, profile not persisted",
                             extra={'user_id': user_id}
                         )
                 except Exception as e:
-                    self.logger.error(
+                    _RESPONSE_LOGGER.error(
                         f"Failed to persist user profile: {e}",
                         exc_info=True
                     )
 
 
-# Lista de interceptores recomendados para registro
-RECOMMENDED_REQUEST_INTERCEPTORS = [
+# Interceptores recomendados para registro (tuplas inmutables)
+RECOMMENDED_REQUEST_INTERCEPTORS = (
     LoggingRequestInterceptor(),
     SessionAttributesInterceptor(),
     ErrorHandlingInterceptor(),
     UserContextInterceptor(),
     LocalizationInterceptor()
-]
+)
 
-RECOMMENDED_RESPONSE_INTERCEPTORS = [
+RECOMMENDED_RESPONSE_INTERCEPTORS = (
     LoggingResponseInterceptor(),
     MetricsInterceptor(),
     SessionPersistenceInterceptor()
-]
+)
@@ -11,8 +11,9 @@ Patterns:
 - Registry: Registro de prototipos
 """
 
-from typing import Dict, Optional, List
-from copy import deepcopy
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from models import (
     Diagnostic,
@@ -25,6 +26,13 @@ from models import (
 )
 
 
+# Campos sobrescribibles de Diagnostic (evita hasattr por cada override)
+_DIAGNOSTIC_FIELDS = frozenset(f.name for f in fields(Diagnostic))
+
+# Campos secuencia de Diagnostic: se guardan como tuplas en el blueprint
+_DIAGNOSTIC_LIST_FIELDS = ('solutions', 'common_causes', 'related_errors')
+
+
 class DiagnosticPrototype:
     """
     Prototipo de diagnostico que puede clonarse.
@@ -42,14 +50,47 @@ class DiagnosticPrototype:
         """
         self._prototype = diagnostic
 
+        # Blueprint: campos escalares como kwargs y listas como tuplas
+        # inmutables, compartidas por todos los clones
+        attrs = vars(diagnostic)
+        self._blueprint = {
+            f.name: attrs[f.name] for f in fields(Diagnostic)
+            if f.name not in _DIAGNOSTIC_LIST_FIELDS
+        }
+        self._solutions = tuple(diagnostic.solutions)
+        self._common_causes = tuple(diagnostic.common_causes)
+        self._related_errors = tuple(diagnostic.related_errors)
+
+        # Instancia compartida para lectores que no modifican el diagnostico
+        self._shared = self.clone()
+
+    def shared(self) -> Diagnostic:
+        """
+        Obtiene la instancia compartida del template, sin copiarla.
+
+        Solo para lectura: modificarla afectaria a todos los lectores.
+
+        Returns:
+            Diagnostico template compartido
+        """
+        return self._shared
+
     def clone(self) -> Diagnostic:
         """
-        Crea una copia profunda del diagnostico.
+        Crea una copia del diagnostico.
+
+        Las secuencias son tuplas compartidas: no pueden modificarse, y
+        clone_with_overrides las reemplaza en lugar de editarlas.
 
         Returns:
             Nuevo diagnostico independiente del original
         """
-        return deepcopy(self._prototype)
+        return Diagnostic(
+            **self._blueprint,
+            solutions=self._solutions,
+            common_causes=self._common_causes,
+            related_errors=self._related_errors
+        )
 
     def clone_with_overrides(
         self,
@@ -65,11 +106,14 @@ class DiagnosticPrototype:
             Diagnostico clonado con modificaciones
         """
         cloned = self.clone()
+        if not kwargs:
+            return cloned
 
-        # Sobrescribir campos proporcionados
+        # Sobrescribir campos proporcionados (solo campos del dataclass)
+        cloned_attrs = cloned.__dict__
         for key, value in kwargs.items():
-            if hasattr(cloned, key):
-                setattr(cloned, key, value)
+            if key in _DIAGNOSTIC_FIELDS:
+                cloned_attrs[key] = value
 
         return cloned
 
@@ -92,12 +136,15 @@ class UserProfilePrototype:
 
     def clone(self) -> UserProfile:
         """
-        Crea una copia profunda del perfil.
+        Obtiene el perfil prototipo.
+
+        UserProfile es inmutable (frozen), asi que el prototipo se
+        comparte directamente sin copiarlo.
 
         Returns:
-            Nuevo perfil independiente del original
+            Perfil prototipo
         """
-        return deepcopy(self._prototype)
+        return self._prototype
 
     def clone_with_overrides(
         self,
@@ -107,15 +154,13 @@ class UserProfilePrototype:
         Clona y sobrescribe campos especificos.
 
         Args:
-            **kwargs: Campos a sobrescribir (os, package_manager, editor)
+            **kwargs: Campos a sobrescribir (os, pm, editor)
 
         Returns:
-            Perfil clonado con modificaciones
+            Perfil nuevo con modificaciones
         """
-        cloned = self.clone()
-
-        # Usar metodo update del UserProfile
-        return cloned.update(**kwargs)
+        # update() ya retorna un perfil nuevo; el prototipo no se modifica
+        return self._prototype.update(**kwargs)
 
 
 class PrototypeRegistry:
@@ -140,6 +185,10 @@ class PrototypeRegistry:
         self._diagnostic_prototypes: Dict[str, DiagnosticPrototype] = {}
         self._profile_prototypes: Dict[str, UserProfilePrototype] = {}
 
+        # Nombres registrados (se invalidan al registrar un prototipo)
+        self._diagnostic_names: Optional[Tuple[str, ...]] = None
+        self._profile_names: Optional[Tuple[str, ...]] = None
+
         # Registrar prototipos predefinidos
         self._register_default_diagnostics()
         self._register_default_profiles()
@@ -247,9 +296,9 @@ class PrototypeRegistry:
         # Profile: Desarrollador Linux
         linux_dev = UserProfilePrototype(
             UserProfile(
-                os=OperatingSystem.LINUX.value,
-                package_manager=PackageManager.PIP.value,
-                editor=Editor.VSCODE.value
+                os=OperatingSystem.LINUX,
+                package_manager=PackageManager.PIP,
+                editor=Editor.VSCODE
             )
         )
         self.register_profile('linux_dev', linux_dev)
@@ -257,9 +306,9 @@ class PrototypeRegistry:
         # Profile: Desarrollador Windows
         windows_dev = UserProfilePrototype(
             UserProfile(
-                os=OperatingSystem.WINDOWS.value,
-                package_manager=PackageManager.PIP.value,
-                editor=Editor.VSCODE.value
+                os=OperatingSystem.WINDOWS,
+                package_manager=PackageManager.PIP,
+                editor=Editor.VSCODE
             )
         )
         self.register_profile('windows_dev', windows_dev)
@@ -267,9 +316,9 @@ class PrototypeRegistry:
         # Profile: Data Scientist
         data_scientist = UserProfilePrototype(
             UserProfile(
-                os=OperatingSystem.LINUX.value,
-                package_manager=PackageManager.CONDA.value,
-                editor=Editor.JUPYTER.value
+                os=OperatingSystem.LINUX,
+                package_manager=PackageManager.CONDA,
+                editor=Editor.JUPYTER
             )
         )
         self.register_profile('data_scientist', data_scientist)
@@ -277,9 +326,9 @@ class PrototypeRegistry:
         # Profile: Mac Developer
         mac_dev = UserProfilePrototype(
             UserProfile(
-                os=OperatingSystem.MACOS.value,
-                package_manager=PackageManager.PIP.value,
-                editor=Editor.VSCODE.value
+                os=OperatingSystem.MACOS,
+                package_manager=PackageManager.PIP,
+                editor=Editor.VSCODE
             )
         )
         self.register_profile('mac_dev', mac_dev)
@@ -297,6 +346,7 @@ class PrototypeRegistry:
             prototype: Prototipo a registrar
         """
         self._diagnostic_prototypes[name] = prototype
+        self._diagnostic_names = None
 
     def register_profile(
         self,
@@ -311,6 +361,7 @@ class PrototypeRegistry:
             prototype: Prototipo a registrar
         """
         self._profile_prototypes[name] = prototype
+        self._profile_names = None
 
     def get_diagnostic(self, name: str) -> Optional[Diagnostic]:
         """
@@ -325,6 +376,22 @@ class PrototypeRegistry:
         prototype = self._diagnostic_prototypes.get(name)
         return prototype.clone() if prototype else None
 
+    def get_diagnostic_readonly(self, name: str) -> Optional[Diagnostic]:
+        """
+        Obtiene el diagnostico prototipo compartido, sin copiarlo.
+
+        Para consumidores que solo leen el template; para modificarlo
+        usar get_diagnostic o get_diagnostic_with_overrides.
+
+        Args:
+            name: Nombre del prototipo
+
+        Returns:
+            Diagnostico compartido o None si no existe
+        """
+        prototype = self._diagnostic_prototypes.get(name)
+        return prototype.shared() if prototype else None
+
     def get_profile(self, name: str) -> Optional[UserProfile]:
         """
         Obtiene una copia del perfil prototipo.
@@ -353,6 +420,9 @@ class PrototypeRegistry:
         Returns:
             Diagnostico modificado o None si no existe
         """
+        if not kwargs:
+            return self.get_diagnostic(name)
+
         prototype = self._diagnostic_prototypes.get(name)
         return prototype.clone_with_overrides(**kwargs) if prototype else None
 
@@ -374,27 +444,59 @@ class PrototypeRegistry:
         prototype = self._profile_prototypes.get(name)
         return prototype.clone_with_overrides(**kwargs) if prototype else None
 
-    def list_diagnostics(self) -> List[str]:
+    def list_diagnostics(self) -> Tuple[str, ...]:
         """
         Lista nombres de diagnosticos registrados.
 
         Returns:
-            Lista de nombres
+            Tupla de nombres (cacheada hasta el proximo registro)
         """
-        return list(self._diagnostic_prototypes.keys())
+        if self._diagnostic_names is None:
+            self._diagnostic_names = tuple(self._diagnostic_prototypes)
+        return self._diagnostic_names
 
-    def list_profiles(self) -> List[str]:
+    def list_profiles(self) -> Tuple[str, ...]:
         """
         Lista nombres de perfiles registrados.
 
         Returns:
-            Lista de nombres
+            Tupla de nombres (cacheada hasta el proximo registro)
         """
-        return list(self._profile_prototypes.keys())
+        if self._profile_names is None:
+            self._profile_names = tuple(self._profile_prototypes)
+        return self._profile_names
+
+
+@lru_cache(maxsize=1)
+def _get_registry() -> PrototypeRegistry:
+    """
+    Obtiene el registro de prototipos, creandolo en el primer uso.
+
+    Los templates no se construyen al importar el modulo: muchas
+    invocaciones (cold start incluido) nunca los usan.
 
+    Returns:
+        Instancia singleton del registro
+    """
+    return PrototypeRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resuelve `registry` de forma lazy (PEP 562).
 
-# Instancia singleton del registro
-registry = PrototypeRegistry()
+    Args:
+        name: Nombre del atributo solicitado
+
+    Returns:
+        Registro de prototipos
+
+    Raises:
+        AttributeError: Si el atributo no existe
+    """
+    if name == 'registry':
+        return _get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Funciones de conveniencia
@@ -408,7 +510,7 @@ def get_diagnostic_template(name: str) -> Optional[Diagnostic]:
     Returns:
         Copia del diagnostico template
     """
-    return registry.get_diagnostic(name)
+    return _get_registry().get_diagnostic(name)
 
 
 def get_profile_template(name: str) -> Optional[UserProfile]:
@@ -421,7 +523,7 @@ def get_profile_template(name: str) -> Optional[UserProfile]:
     Returns:
         Copia del perfil template
     """
-    return registry.get_profile(name)
+    return _get_registry().get_profile(name)
 
 
 def create_custom_diagnostic(
@@ -438,7 +540,7 @@ def create_custom_diagnostic(
     Returns:
         Diagnostico personalizado o None si template no existe
     """
-    return registry.get_diagnostic_with_overrides(base_template, **overrides)
+    return _get_registry().get_diagnostic_with_overrides(base_template, **overrides)
 
 
 def create_custom_profile(
@@ -455,4 +557,4 @@ def create_custom_profile(
     Returns:
         Perfil personalizado o None si template no existe
     """
-    return registry.get_profile_with_overrides(base_template, **overrides)
+    return _get_registry().get_profile_with_overrides(base_template, **overrides)
@@ -9,12 +9,53 @@ Patterns:
 - Fluent Interface: Encadenamiento de metodos
 """
 
+from operator import attrgetter
 from typing import Optional
 from ask_sdk_model import Response
 from ask_sdk_model.ui import SimpleCard, StandardCard, Image
 from utils import get_logger, truncate_text
 
 
+# Logger compartido: build() se ejecuta en cada respuesta
+_LOGGER = get_logger("AlexaResponseBuilder")
+
+# Prompts estandar (constantes, no se rearman por respuesta)
+_DIAGNOSTIC_FOLLOW_UP_PROMPT = (
+    "¿Quieres saber por que ocurre esto, "
+    "necesitas mas opciones, "
+    "o prefieres que te lo envie a tu telefono?"
+)
+_ERROR_PROMPT = "¿Puedes intentar de nuevo?"
+
+# Plantillas de with_solution (mismo estilo %-format que factories.py)
+_SOLUTION_VOICE_TEMPLATE = "Solucion %s de %s. %s"
+_SOLUTION_VOICE_MORE_TEMPLATE = (
+    "Solucion %s de %s. %s Hay %s soluciones mas disponibles."
+)
+_SOLUTION_CARD_TITLE_TEMPLATE = "Solucion %s: %s"
+_SOLUTION_CARD_TEMPLATE = (
+    "**Solucion %s de %s**\n\n"
+    "%s\n\n"
+    "**Siguientes pasos:**\n"
+    "- Di 'dame mas opciones' para ver otras soluciones\n"
+    "- Di 'por que pasa esto' para entender la causa"
+)
+
+# Nombres amigables de los campos del perfil
+_FIELD_NAMES = {
+    'os': 'sistema operativo',
+    'pm': 'gestor de paquetes',
+    'editor': 'editor'
+}
+
+# Lectura del valor de cada campo del perfil (dispatch en vez de if/elif)
+_FIELD_GETTERS = {
+    'os': attrgetter('os.value'),
+    'pm': attrgetter('package_manager.value'),
+    'editor': attrgetter('editor.value')
+}
+
+
 class AlexaResponseBuilder:
     """
     Builder para construir respuestas de Alexa con interfaz fluida.
@@ -32,6 +73,15 @@ class AlexaResponseBuilder:
         ... )
     """
 
+    # Se instancia por request: sin __dict__ por instancia
+    __slots__ = (
+        'handler_input',
+        '_response_builder',
+        '_speech_text',
+        '_reprompt_text',
+        '_should_end_session'
+    )
+
     def __init__(self, handler_input):
         """
         Inicializa el builder.
@@ -182,12 +232,7 @@ class AlexaResponseBuilder:
         Returns:
             Self para encadenamiento
         """
-        prompt = (
-            "¿Quieres saber por que ocurre esto, "
-            "necesitas mas opciones, "
-            "o prefieres que te lo envie a tu telefono?"
-        )
-        return self.ask(prompt)
+        return self.ask(_DIAGNOSTIC_FOLLOW_UP_PROMPT)
 
     def with_error_prompt(self) -> 'AlexaResponseBuilder':
         """
@@ -196,7 +241,7 @@ class AlexaResponseBuilder:
         Returns:
             Self para encadenamiento
         """
-        return self.ask("¿Puedes intentar de nuevo?")
+        return self.ask(_ERROR_PROMPT)
 
     def build(self) -> Response:
         """
@@ -205,24 +250,33 @@ class AlexaResponseBuilder:
         Returns:
             Response de Alexa SDK
         """
-        logger = get_logger("AlexaResponseBuilder")
-        logger.info(
-            f"Building response - speech: {bool(self._speech_text)}, reprompt: {bool(self._reprompt_text)}, end_session: {self._should_end_session}")
+        speech_text = self._speech_text
+        reprompt_text = self._reprompt_text
+        should_end_session = self._should_end_session
+        response_builder = self._response_builder
 
-        if self._speech_text:
-            logger.info(f"Adding speech: '{self._speech_text[:100]}...'")
-            self._response_builder.speak(self._speech_text)
-        else:
-            logger.warning("No speech text set!")
+        # Nada que aplicar (p.ej. solo card): retornar la respuesta tal cual
+        if not (speech_text or reprompt_text or should_end_session):
+            _LOGGER.warning("No speech text set!")
+            return response_builder.response
 
-        if self._reprompt_text and not self._should_end_session:
-            logger.info(f"Adding reprompt: '{self._reprompt_text[:50]}...'")
-            self._response_builder.ask(self._reprompt_text)
+        _LOGGER.info(
+            "Building response - speech: %s, reprompt: %s, end_session: %s",
+            bool(speech_text), bool(reprompt_text), should_end_session)
 
-        if self._should_end_session:
-            self._response_builder.set_should_end_session(True)
+        if speech_text:
+            _LOGGER.info("Adding speech: '%.100s...'", speech_text)
+            response_builder.speak(speech_text)
+        else:
+            _LOGGER.warning("No speech text set!")
 
-        return self._response_builder.response
+        if should_end_session:
+            response_builder.set_should_end_session(True)
+        elif reprompt_text:
+            _LOGGER.info("Adding reprompt: '%.50s...'", reprompt_text)
+            response_builder.ask(reprompt_text)
+
+        return response_builder.response
 
 
 class DiagnosticResponseBuilder:
@@ -233,6 +287,8 @@ class DiagnosticResponseBuilder:
     para diagnosticos de errores.
     """
 
+    __slots__ = ('base_builder', 'handler_input')
+
     def __init__(self, handler_input):
         """
         Inicializa el builder de diagnosticos.
@@ -295,29 +351,23 @@ class DiagnosticResponseBuilder:
         Returns:
             Self para encadenamiento
         """
-        voice_text = (
-            f"Solucion {solution_number} de {total_solutions}. "
-            f"{solution}"
-        )
-
         remaining = total_solutions - solution_number
         if remaining > 0:
-            voice_text += f" Hay {remaining} soluciones mas disponibles."
+            voice_text = _SOLUTION_VOICE_MORE_TEMPLATE % (
+                solution_number, total_solutions, solution, remaining)
+        else:
+            voice_text = _SOLUTION_VOICE_TEMPLATE % (
+                solution_number, total_solutions, solution)
 
         self.base_builder.speak(voice_text)
 
         # Card con la solucion
-        card_title = f"Solucion {solution_number}: {error_type}"
-        card_text = (
-            f"**Solucion {solution_number} de {total_solutions}**\n\n"
-            f"{solution}\n\n"
-            f"**Siguientes pasos:**\n"
-            f"- Di 'dame mas opciones' para ver otras soluciones\n"
-            f"- Di 'por que pasa esto' para entender la causa"
+        self.base_builder.simple_card(
+            _SOLUTION_CARD_TITLE_TEMPLATE % (solution_number, error_type),
+            _SOLUTION_CARD_TEMPLATE % (
+                solution_number, total_solutions, solution)
         )
 
-        self.base_builder.simple_card(card_title, card_text)
-
         return self
 
     def with_explanation(
@@ -393,6 +443,8 @@ class ProfileResponseBuilder:
     Maneja confirmaciones de cambios de perfil y visualizacion.
     """
 
+    __slots__ = ('base_builder',)
+
     def __init__(self, handler_input):
         """
         Inicializa el builder de perfil.
@@ -426,14 +478,15 @@ class ProfileResponseBuilder:
             new_value = self._get_field_value(new_profile, field)
             speak_text = f"Perfecto. Actualice tu {field_name} a {new_value}."
         else:
-            changes = []
-            for field in changed_fields:
-                field_name = self._get_field_name(field)
-                new_value = self._get_field_value(new_profile, field)
-                changes.append(f"{field_name} a {new_value}")
+            changes = [
+                f"{self._get_field_name(field)} a "
+                f"{self._get_field_value(new_profile, field)}"
+                for field in changed_fields
+            ]
 
-            changes_text = ", ".join(changes[:-1]) + f" y {changes[-1]}"
-            speak_text = f"Perfecto. Actualice tu {changes_text}."
+            # "a, b y c": se unen todos y la ultima coma pasa a " y "
+            head, _, last = ", ".join(changes).rpartition(", ")
+            speak_text = f"Perfecto. Actualice tu {head} y {last}."
 
         speak_text += (
             " Ahora las soluciones estaran personalizadas para tu entorno."
@@ -449,47 +502,33 @@ class ProfileResponseBuilder:
 
     def _get_field_name(self, field: str) -> str:
         """Obtiene nombre amigable del campo."""
-        names = {
-            'os': 'sistema operativo',
-            'pm': 'gestor de paquetes',
-            'editor': 'editor'
-        }
-        return names.get(field, field)
+        return _FIELD_NAMES.get(field, field)
 
     def _get_field_value(self, profile, field: str) -> str:
         """Obtiene valor del campo."""
-        if field == 'os':
-            return profile.os.value
-        if field == 'pm':
-            return profile.package_manager.value
-        if field == 'editor':
-            return profile.editor.value
-        return 'desconocido'
+        getter = _FIELD_GETTERS.get(field)
+        return getter(profile) if getter else 'desconocido'
 
     def _build_profile_card(self, profile, changed_fields: list) -> str:
         """Construye texto de card con perfil."""
-        lines = [
+        changed_lines = (
+            "Campos actualizados:",
+            *[f"- {_FIELD_NAMES.get(field, field).capitalize()}"
+              for field in changed_fields],
+            ""
+        ) if changed_fields else ()
+
+        return "\n".join((
             "Tu perfil tecnico actualizado:",
             "",
             f"Sistema Operativo: {profile.os.value.upper()}",
             f"Gestor de Paquetes: {profile.package_manager.value.upper()}",
             f"Editor: {profile.editor.value.upper()}",
-            ""
-        ]
-
-        if changed_fields:
-            lines.append("Campos actualizados:")
-            for field in changed_fields:
-                field_name = self._get_field_name(field)
-                lines.append(f"- {field_name.capitalize()}")
-            lines.append("")
-
-        lines.extend([
+            "",
+            *changed_lines,
             "Las soluciones de diagnostico ahora estaran",
             "personalizadas para tu entorno."
-        ])
-
-        return "\n".join(lines)
+        ))
 
     def build(self) -> Response:
         """
@@ -4,9 +4,12 @@ Extractores de soluciones usando Strategy Pattern.
 Este modulo implementa el patron Strategy para extraer soluciones
 de diferentes formatos de datos del Knowledge Base, eliminando
 la necesidad de multiples if/else anidados.
+
+Los datos vienen de JSON (dict/list nativos), por eso los chequeos de
+formato usan `type(x) is dict` en lugar de isinstance.
 """
 
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from abc import ABC, abstractmethod
 from models import UserProfile
 
@@ -16,9 +19,12 @@ class SolutionExtractor(ABC):
     Interfaz base para extractores de soluciones.
 
     Implementa el patron Strategy para diferentes formatos
-    de datos de soluciones.
+    de datos de soluciones. Los extractores no tienen estado
+    (sin __dict__ por instancia).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def can_extract(self, solutions_data: Any) -> bool:
         """
@@ -60,13 +66,15 @@ class NestedDictExtractor(SolutionExtractor):
     }
     """
 
+    __slots__ = ()
+
     def can_extract(self, solutions_data: Any) -> bool:
         """Verifica si es un diccionario anidado."""
-        if not isinstance(solutions_data, dict):
+        if type(solutions_data) is not dict:
             return False
 
         return any(
-            isinstance(v, dict)
+            type(v) is dict
             for v in solutions_data.values()
         )
 
@@ -76,27 +84,29 @@ class NestedDictExtractor(SolutionExtractor):
         user_profile: UserProfile
     ) -> List[str]:
         """Extrae soluciones del diccionario anidado."""
-        os_key = user_profile.os.value
-        pm_key = user_profile.package_manager.value
-
-        os_solutions = solutions_data.get(os_key, {})
+        os_key = user_profile.os_key
+        pm_key = user_profile.pm_key
 
-        if isinstance(os_solutions, dict):
-            solutions = os_solutions.get(pm_key, [])
+        os_solutions = solutions_data.get(os_key)
 
-            if not solutions and os_solutions:
-                solutions = next(iter(os_solutions.values()), [])
+        if type(os_solutions) is dict:
+            solutions = (
+                os_solutions.get(pm_key)
+                or next(iter(os_solutions.values()), [])
+            )
         else:
-            solutions = os_solutions if isinstance(os_solutions, list) else []
+            solutions = os_solutions if type(os_solutions) is list else []
 
-        if not solutions and 'linux' in solutions_data:
-            linux_solutions = solutions_data['linux']
-            if isinstance(linux_solutions, dict):
-                solutions = linux_solutions.get(pm_key, [])
-                if not solutions:
-                    solutions = next(iter(linux_solutions.values()), [])
+        if not solutions:
+            # Fallback a linux con una sola busqueda
+            linux_solutions = solutions_data.get('linux')
+            if type(linux_solutions) is dict:
+                solutions = (
+                    linux_solutions.get(pm_key)
+                    or next(iter(linux_solutions.values()), [])
+                )
 
-        return solutions if isinstance(solutions, list) else []
+        return solutions if type(solutions) is list else []
 
 
 class FlatDictExtractor(SolutionExtractor):
@@ -111,13 +121,15 @@ class FlatDictExtractor(SolutionExtractor):
     }
     """
 
+    __slots__ = ()
+
     def can_extract(self, solutions_data: Any) -> bool:
         """Verifica si es un diccionario plano con listas."""
-        if not isinstance(solutions_data, dict):
+        if type(solutions_data) is not dict:
             return False
 
         return any(
-            isinstance(v, list)
+            type(v) is list
             for v in solutions_data.values()
         )
 
@@ -127,18 +139,16 @@ class FlatDictExtractor(SolutionExtractor):
         user_profile: UserProfile
     ) -> List[str]:
         """Extrae soluciones del diccionario plano."""
-        os_key = user_profile.os.value
-
-        # Intentar obtener soluciones para el OS especifico
-        solutions = solutions_data.get(os_key, [])
-
-        if not solutions and 'linux' in solutions_data:
-            solutions = solutions_data['linux']
+        os_key = user_profile.os_key
 
-        if not solutions and solutions_data:
-            solutions = next(iter(solutions_data.values()), [])
+        # OS especifico, luego linux, luego la primera entrada disponible
+        solutions = (
+            solutions_data.get(os_key)
+            or solutions_data.get('linux')
+            or next(iter(solutions_data.values()), [])
+        )
 
-        return solutions if isinstance(solutions, list) else []
+        return solutions if type(solutions) is list else []
 
 
 class ListExtractor(SolutionExtractor):
@@ -149,9 +159,11 @@ class ListExtractor(SolutionExtractor):
     ["solucion 1", "solucion 2", ...]
     """
 
+    __slots__ = ()
+
     def can_extract(self, solutions_data: Any) -> bool:
         """Verifica si es una lista directa."""
-        return isinstance(solutions_data, list)
+        return type(solutions_data) is list
 
     def extract(
         self,
@@ -167,6 +179,8 @@ class EmptyExtractor(SolutionExtractor):
     Extractor fallback para datos vacios o invalidos.
     """
 
+    __slots__ = ()
+
     def can_extract(self, solutions_data: Any) -> bool:
         """Siempre puede "extraer" (retornando lista vacia)."""
         return True
@@ -180,22 +194,77 @@ class EmptyExtractor(SolutionExtractor):
         return []
 
 
+# Extractores sin estado: una sola instancia compartida por modulo
+_NESTED_EXTRACTOR = NestedDictExtractor()
+_FLAT_EXTRACTOR = FlatDictExtractor()
+_LIST_EXTRACTOR = ListExtractor()
+_EMPTY_EXTRACTOR = EmptyExtractor()
+
+_DEFAULT_EXTRACTORS = (
+    _NESTED_EXTRACTOR,
+    _FLAT_EXTRACTOR,
+    _LIST_EXTRACTOR,
+    _EMPTY_EXTRACTOR
+)
+
+
+def _extract_from_dict(
+    solutions_data: Dict[str, Any],
+    user_profile: UserProfile
+) -> List[str]:
+    """
+    Elige entre formato anidado y plano y extrae las soluciones.
+
+    Mismo orden que la cadena: anidado si algun valor es dict,
+    plano si alguno es lista, vacio en otro caso. Clasifica en una
+    sola pasada (los datos anidados se detectan en el primer valor).
+
+    Args:
+        solutions_data: Diccionario de soluciones del KB
+        user_profile: Perfil del usuario
+
+    Returns:
+        Lista de soluciones extraidas
+    """
+    has_list = False
+    for value in solutions_data.values():
+        value_type = type(value)
+        if value_type is dict:
+            return _NESTED_EXTRACTOR.extract(solutions_data, user_profile)
+        if value_type is list:
+            has_list = True
+
+    if has_list:
+        return _FLAT_EXTRACTOR.extract(solutions_data, user_profile)
+    return []
+
+
+# Despacho por tipo de datos con los extractores por defecto
+_TYPE_DISPATCH: Dict[type, Callable[..., List[str]]] = {
+    dict: _extract_from_dict,
+    list: _LIST_EXTRACTOR.extract
+}
+
+
 class SolutionExtractionStrategy:
     """
     Contexto que usa diferentes estrategias de extraccion.
 
-    Implementa Chain of Responsibility para intentar extractores
-    en orden hasta encontrar uno compatible.
+    Con los extractores por defecto despacha por tipo de datos (una
+    busqueda en dict); si se agregan extractores personalizados usa
+    Chain of Responsibility, intentandolos en orden hasta encontrar
+    uno compatible.
     """
 
     def __init__(self):
         """Inicializa con extractores en orden de prioridad."""
-        self.extractors: List[SolutionExtractor] = [
-            NestedDictExtractor(),
-            FlatDictExtractor(),
-            ListExtractor(),
-            EmptyExtractor()
-        ]
+        # Lista propia (add_extractor la modifica); extractores compartidos
+        self.extractors: List[SolutionExtractor] = list(_DEFAULT_EXTRACTORS)
+
+        # Despacho por tipo (None = usar la cadena de extractores)
+        self._dispatch: Optional[Dict[type, Callable[..., List[str]]]] = (
+            _TYPE_DISPATCH
+        )
 
     def extract_solutions(
         self,
@@ -216,6 +285,11 @@ class SolutionExtractionStrategy:
             >>> strategy = SolutionExtractionStrategy()
             >>> solutions = strategy.extract_solutions(kb_data, profile)
         """
+        dispatch = self._dispatch
+        if dispatch is not None:
+            extract = dispatch.get(type(solutions_data))
+            return extract(solutions_data, user_profile) if extract else []
+
         for extractor in self.extractors:
             if extractor.can_extract(solutions_data):
                 return extractor.extract(solutions_data, user_profile)
@@ -234,6 +308,9 @@ class SolutionExtractionStrategy:
             extractor: Instancia del extractor
             priority: Posicion en la cadena (-1 = antes del EmptyExtractor)
         """
+        # Con extractores personalizados se recorre la cadena completa
+        self._dispatch = None
+
         if priority == -1:
             self.extractors.insert(-1, extractor)
         else:
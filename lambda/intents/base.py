@@ -7,8 +7,12 @@ Note:
     por todos los modulos sin riesgo de dependencias circulares.
 """
 
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Iterator, Mapping
 
 # Importar LoggerManager desde utils centralizado
 from utils import get_logger_manager, get_logger
@@ -16,7 +20,7 @@ from utils import get_logger_manager, get_logger
 from ask_sdk_core.dispatch_components import AbstractRequestHandler
 from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_model import Response
-from ask_sdk_core.utils import is_intent_name, get_slot_value
+from ask_sdk_core.utils import is_intent_name
 
 # Importaciones de modelos
 from models import UserProfile, Diagnostic
@@ -29,12 +33,58 @@ from services.storage import storage_service
 # Funciones Helper Independientes
 # ============================================================================
 
+# Textos de la respuesta de error generica de los handlers
+_ERROR_SPEAK = (
+    "Lo siento, tuve un problema procesando tu solicitud. "
+    "Por favor, intenta de nuevo."
+)
+_ERROR_REPROMPT = "En que mas puedo ayudarte?"
+
+# Escrituras a DynamoDB en segundo plano (guardado del perfil) mientras el
+# request sigue trabajando. StorageService usa un recurso boto3 por thread.
+_STORAGE_WRITE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix='storage-write'
+)
+
+# Escrituras pendientes del request (request_attributes) y espera maxima
+# antes de retornar: Lambda congela los threads al terminar la invocacion
+_PENDING_WRITES_KEY = '_pending_storage_writes'
+_PENDING_WRITES_TIMEOUT_SECONDS = 5.0
+
+# Clave en request_attributes del perfil ya resuelto en este request:
+# (dict de sesion del que se construyo, UserProfile)
+_PROFILE_MEMO_KEY = '_user_profile'
+
+# Idem para el ultimo diagnostico: (dict de sesion, Diagnostic)
+_DIAGNOSTIC_MEMO_KEY = '_last_diagnostic'
+
+
+def _remember_profile(
+    handler_input: HandlerInput,
+    profile_dict: Optional[Dict[str, Any]],
+    profile: UserProfile
+) -> None:
+    """
+    Memoriza el perfil resuelto durante el request actual.
+
+    Args:
+        handler_input: Input del request
+        profile_dict: Dict de sesion del que proviene el perfil
+        profile: Perfil resuelto (inmutable, se puede compartir)
+    """
+    handler_input.attributes_manager.request_attributes[_PROFILE_MEMO_KEY] = (
+        profile_dict, profile)
+
+
 def get_user_profile_from_session(handler_input: HandlerInput) -> UserProfile:
     """
     Funcion helper para obtener perfil del usuario desde session attributes.
 
     Esta funcion estatica puede ser usada por cualquier handler sin necesidad
-    de instanciar BaseIntentHandler.
+    de instanciar BaseIntentHandler. El perfil se resuelve una sola vez por
+    request: las llamadas siguientes lo reutilizan mientras el dict de
+    sesion sea el mismo.
 
     Args:
         handler_input: Input del request
@@ -42,15 +92,23 @@ def get_user_profile_from_session(handler_input: HandlerInput) -> UserProfile:
     Returns:
         UserProfile: Perfil del usuario (usa default si no existe)
     """
-    logger = get_logger(__name__)
-
-    # Intentar obtener de session attributes (cache)
     session_attr = handler_input.attributes_manager.session_attributes
     profile_dict = session_attr.get('user_profile')
 
+    # Perfil ya resuelto en este request (invalido si la sesion cambio)
+    memo = handler_input.attributes_manager.request_attributes.get(
+        _PROFILE_MEMO_KEY)
+    if memo is not None and memo[0] is profile_dict:
+        return memo[1]
+
+    logger = get_logger(__name__)
+
+    # Intentar obtener de session attributes (cache)
     if profile_dict:
         logger.info("Profile loaded from session cache")
-        return UserProfile.from_dict(profile_dict)
+        profile = UserProfile.from_dict(profile_dict)
+        _remember_profile(handler_input, profile_dict, profile)
+        return profile
 
     # Intentar cargar desde DynamoDB
     try:
@@ -60,14 +118,96 @@ def get_user_profile_from_session(handler_input: HandlerInput) -> UserProfile:
         if profile:
             logger.info("Profile loaded from DynamoDB")
             # Cachear en session para requests subsecuentes
-            session_attr['user_profile'] = profile.to_dict()
+            profile_dict = profile.to_dict()
+            session_attr['user_profile'] = profile_dict
+            _remember_profile(handler_input, profile_dict, profile)
             return profile
     except Exception as e:
         logger.warning(f"Failed to load profile from DynamoDB: {e}")
 
     # Retornar perfil por defecto
     logger.info("Using default profile")
-    return UserProfile()  # Usa defaults: linux, pip, vscode
+    profile = UserProfile()  # Usa defaults: linux, pip, vscode
+    _remember_profile(handler_input, profile_dict, profile)
+    return profile
+
+
+# Slots vacios compartidos (solo lectura) para requests sin intent o slots
+_NO_SLOTS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _get_request_slots(handler_input: HandlerInput) -> Mapping[str, Any]:
+    """
+    Obtiene request.intent.slots sin excepciones.
+
+    getattr con default en vez de try/except: sin intent (p.ej.
+    LaunchRequest) o sin slots se retorna _NO_SLOTS.
+
+    Args:
+        handler_input: Input del request
+
+    Returns:
+        Mapping[str, Any]: Slots del SDK (nombre -> Slot)
+    """
+    intent = getattr(handler_input.request_envelope.request, 'intent', None)
+    return getattr(intent, 'slots', None) or _NO_SLOTS
+
+
+def _get_slot_value(handler_input: HandlerInput, slot_name: str) -> Optional[str]:
+    """
+    Obtiene el valor de un slot, o None si el request no lo trae.
+
+    Args:
+        handler_input: Input del request
+        slot_name: Nombre del slot
+
+    Returns:
+        Optional[str]: Valor del slot
+    """
+    slot = _get_request_slots(handler_input).get(slot_name)
+    return slot.value if slot is not None else None
+
+
+class _SlotView(Mapping):
+    """
+    Vista perezosa de los slots del request (nombre -> valor).
+
+    El diccionario de valores se construye solo la primera vez que se
+    lee la vista (acceso, iteracion o repr al formatear un log).
+    """
+
+    __slots__ = ('_slots', '_values')
+
+    def __init__(self, slots: Dict[str, Any]):
+        """
+        Args:
+            slots: request.intent.slots del SDK (nombre -> Slot)
+        """
+        self._slots = slots
+        self._values: Optional[Dict[str, Any]] = None
+
+    def _materialize(self) -> Dict[str, Any]:
+        """Construye (una vez) el diccionario de slots con valor."""
+        values = self._values
+        if values is None:
+            values = self._values = {
+                name: slot.value
+                for name, slot in self._slots.items()
+                if slot.value
+            }
+        return values
+
+    def __getitem__(self, name: str) -> Any:
+        return self._materialize()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
 
 
 # ============================================================================
@@ -88,6 +228,14 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
     Todos los handlers especificos deben heredar de esta clase.
     """
 
+    # Atributos fijos leidos en cada request (lectura via slot)
+    __slots__ = (
+        'logger_manager',
+        'logger',
+        'storage_service',
+        '_is_own_intent'
+    )
+
     def __init__(self):
         """Inicializa el handler base con logger singleton."""
         # Usar el singleton LoggerManager desde utils
@@ -95,6 +243,9 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         self.logger = get_logger(self.__class__.__name__)
         self.storage_service = storage_service
 
+        # Predicado del SDK creado una vez (intent_name es constante)
+        self._is_own_intent = is_intent_name(self.intent_name)
+
     @property
     @abstractmethod
     def intent_name(self) -> str:
@@ -115,7 +266,7 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         Returns:
             bool: True si este handler puede manejar el request
         """
-        return is_intent_name(self.intent_name)(handler_input)
+        return self._is_own_intent(handler_input)
 
     def handle(self, handler_input: HandlerInput) -> Response:
         """
@@ -127,6 +278,7 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         3. Ejecucion de la logica especifica (handle_intent)
         4. Logging de la respuesta
         5. Manejo de errores
+        6. Espera de escrituras de storage pendientes
 
         Args:
             handler_input: Input del request de Alexa
@@ -151,6 +303,9 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
                 f"Error handling intent {self.intent_name}: {str(e)}", exc_info=True)
             return self._build_error_response(handler_input, e)
 
+        finally:
+            self._wait_for_storage_writes(handler_input)
+
     @abstractmethod
     def handle_intent(self, handler_input: HandlerInput) -> Response:
         """
@@ -180,13 +335,9 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         Returns:
             Optional[str]: Valor del slot o None si no existe
         """
-        try:
-            return get_slot_value(handler_input, slot_name)
-        except Exception as e:
-            self.logger.warning(f"Error getting slot '{slot_name}': {str(e)}")
-            return None
+        return _get_slot_value(handler_input, slot_name)
 
-    def get_all_slots(self, handler_input: HandlerInput) -> Dict[str, Any]:
+    def get_all_slots(self, handler_input: HandlerInput) -> Mapping[str, Any]:
         """
         Obtiene todos los slots del request.
 
@@ -194,23 +345,13 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
             handler_input: Input del request
 
         Returns:
-            Dict[str, Any]: Diccionario con todos los slots
+            Mapping[str, Any]: Vista de solo lectura con los slots con valor
         """
-        try:
-            request = handler_input.request_envelope.request
-            if hasattr(request, 'intent') and hasattr(request.intent, 'slots'):
-                slots = request.intent.slots
-                if slots is None:
-                    return {}
-                return {
-                    name: slot.value
-                    for name, slot in slots.items()
-                    if slot.value
-                }
-        except Exception as e:
-            self.logger.warning(f"Error getting all slots: {str(e)}")
+        slots = _get_request_slots(handler_input)
+        if not slots:
+            return _NO_SLOTS
 
-        return {}
+        return _SlotView(slots)
 
     # ========================================================================
     # Metodos de Utilidad para Session Attributes
@@ -332,34 +473,106 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         """
         Guarda el perfil del usuario en session y DynamoDB.
 
+        La sesion se actualiza de inmediato; la escritura en DynamoDB corre
+        en segundo plano mientras se arma la respuesta, y handle() la
+        espera antes de retornar.
+
         Args:
             handler_input: Input del request
             profile: Perfil a guardar
         """
-        # Guardar en session (cache)
-        self.set_session_attribute(
-            handler_input, 'user_profile', profile.to_dict())
+        # Guardar en session (cache) y actualizar el perfil del request
+        profile_dict = profile.to_dict()
+        self.set_session_attribute(handler_input, 'user_profile', profile_dict)
+        _remember_profile(handler_input, profile_dict, profile)
 
-        # Guardar en DynamoDB (mejor esfuerzo)
+        # Guardar en DynamoDB (mejor esfuerzo, en segundo plano)
         try:
             user_id = self.get_user_id(handler_input)
-            success = storage_service.save_user_profile(user_id, profile)
-
-            if success:
-                self.logger.info(
-                    "Profile saved to DynamoDB",
-                    extra={'user_id': user_id}
-                )
-            else:
-                self.logger.warning(
-                    "DynamoDB not available, profile saved only in session",
-                    extra={'user_id': user_id}
-                )
+            future = self.submit_storage_write(
+                handler_input, storage_service.save_user_profile,
+                user_id, profile)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to save profile to DynamoDB: {e}",
+                exc_info=True
+            )
+            return
+
+        future.add_done_callback(
+            lambda done: self._log_profile_write(user_id, done))
+
+    def submit_storage_write(
+        self,
+        handler_input: HandlerInput,
+        write: Callable[..., Any],
+        *args: Any
+    ) -> Future:
+        """
+        Lanza una escritura de storage en segundo plano.
+
+        La escritura corre mientras se arma la respuesta; handle() la
+        espera antes de retornar.
+
+        Args:
+            handler_input: Input del request
+            write: Metodo de StorageService a ejecutar
+            *args: Argumentos para write
+
+        Returns:
+            Future: Resultado de la escritura
+        """
+        future = _STORAGE_WRITE_EXECUTOR.submit(write, *args)
+        handler_input.attributes_manager.request_attributes.setdefault(
+            _PENDING_WRITES_KEY, []).append(future)
+        return future
+
+    def _log_profile_write(self, user_id: str, future: Future) -> None:
+        """
+        Registra el resultado de una escritura de perfil en DynamoDB.
+
+        Args:
+            user_id: ID del usuario
+            future: Future de StorageService.save_user_profile
+        """
+        try:
+            success = future.result()
         except Exception as e:
             self.logger.error(
                 f"Failed to save profile to DynamoDB: {e}",
                 exc_info=True
             )
+            return
+
+        if success:
+            self.logger.info(
+                "Profile saved to DynamoDB",
+                extra={'user_id': user_id}
+            )
+        else:
+            self.logger.warning(
+                "DynamoDB not available, profile saved only in session",
+                extra={'user_id': user_id}
+            )
+
+    def _wait_for_storage_writes(self, handler_input: HandlerInput) -> None:
+        """
+        Espera las escrituras de storage lanzadas durante el request.
+
+        Args:
+            handler_input: Input del request
+        """
+        pending = handler_input.attributes_manager.request_attributes.pop(
+            _PENDING_WRITES_KEY, None)
+        if not pending:
+            return
+
+        _, not_done = wait(pending, timeout=_PENDING_WRITES_TIMEOUT_SECONDS)
+        if not_done:
+            self.logger.warning(
+                "Storage write still pending after %.1fs",
+                _PENDING_WRITES_TIMEOUT_SECONDS
+            )
 
     def _get_default_profile(self) -> UserProfile:
         """
@@ -389,9 +602,18 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         """
         diagnostic_dict = self.get_session_attribute(
             handler_input, 'last_diagnostic')
-        if diagnostic_dict:
-            return Diagnostic.from_dict(diagnostic_dict)
-        return None
+        if not diagnostic_dict:
+            return None
+
+        # Diagnostico ya construido en este request (mismo dict de sesion)
+        request_attrs = handler_input.attributes_manager.request_attributes
+        memo = request_attrs.get(_DIAGNOSTIC_MEMO_KEY)
+        if memo is not None and memo[0] is diagnostic_dict:
+            return memo[1]
+
+        diagnostic = Diagnostic.from_dict(diagnostic_dict)
+        request_attrs[_DIAGNOSTIC_MEMO_KEY] = (diagnostic_dict, diagnostic)
+        return diagnostic
 
     def save_last_diagnostic(
         self,
@@ -405,8 +627,11 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
             handler_input: Input del request
             diagnostic: Diagnostico a guardar
         """
+        diagnostic_dict = diagnostic.to_dict()
         self.set_session_attribute(
-            handler_input, 'last_diagnostic', diagnostic.to_dict())
+            handler_input, 'last_diagnostic', diagnostic_dict)
+        handler_input.attributes_manager.request_attributes[
+            _DIAGNOSTIC_MEMO_KEY] = (diagnostic_dict, diagnostic)
 
     # ========================================================================
     # Metodos de Logging
@@ -419,6 +644,10 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         Args:
             handler_input: Input del request
         """
+        # Sin INFO habilitado (produccion) no se extraen user/locale/slots
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         try:
             user_id = self.get_user_id(handler_input)
             locale = self.get_locale(handler_input)
@@ -441,8 +670,11 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         Args:
             response: Respuesta generada
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         try:
-            has_card = hasattr(response, 'card') and response.card is not None
+            has_card = getattr(response, 'card', None) is not None
             should_end = response.should_end_session
 
             # Usar el metodo especializado del singleton
@@ -473,17 +705,10 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
         Returns:
             Response: Respuesta de error
         """
-        speak_output = (
-            "Lo siento, tuve un problema procesando tu solicitud. "
-            "Por favor, intenta de nuevo."
-        )
-
-        reprompt = "En que mas puedo ayudarte?"
-
         return (
             handler_input.response_builder
-            .speak(speak_output)
-            .ask(reprompt)
+            .speak(_ERROR_SPEAK)
+            .ask(_ERROR_REPROMPT)
             .response
         )
 
@@ -492,6 +717,14 @@ class BaseIntentHandler(AbstractRequestHandler, ABC):
 # Clases de Utilidad
 # ============================================================================
 
+# Valores validos por campo del perfil (busqueda O(1), sin rearmar)
+_VALID_PROFILE_VALUES = {
+    'os': frozenset({'Windows', 'macOS', 'Linux', 'WSL'}),
+    'package_manager': frozenset({'pip', 'conda', 'poetry'}),
+    'editor': frozenset({'VSCode', 'PyCharm', 'Jupyter'})
+}
+
+
 class IntentValidator:
     """
     Validador de datos para intents.
@@ -543,13 +776,7 @@ class IntentValidator:
         Returns:
             bool: True si el valor es valido
         """
-        valid_values = {
-            'os': ['Windows', 'macOS', 'Linux', 'WSL'],
-            'package_manager': ['pip', 'conda', 'poetry'],
-            'editor': ['VSCode', 'PyCharm', 'Jupyter']
-        }
-
-        return field in valid_values and value in valid_values[field]
+        return value in _VALID_PROFILE_VALUES.get(field, ())
 
 
 class SessionHelper:
@@ -577,8 +804,7 @@ class SessionHelper:
             int: Valor actualizado del contador
         """
         session_attr = handler_input.attributes_manager.session_attributes
-        current_value = session_attr.get(counter_name, 0)
-        new_value = current_value + 1
+        new_value = session_attr.get(counter_name, 0) + 1
         session_attr[counter_name] = new_value
         return new_value
 
@@ -601,15 +827,12 @@ class SessionHelper:
             max_items: Numero maximo de items a mantener
         """
         session_attr = handler_input.attributes_manager.session_attributes
-        history = session_attr.get(history_key, [])
+        history = session_attr.setdefault(history_key, [])
 
         history.append(item)
 
-        # Mantener solo los ultimos max_items
-        if len(history) > max_items:
-            history = history[-max_items:]
-
-        session_attr[history_key] = history
+        # Mantener solo los ultimos max_items (recorte in-place)
+        del history[:-max_items]
 
     @staticmethod
     def get_history(
@@ -646,17 +869,11 @@ def require_profile(func):
 
         if not profile.is_configured:
             # Guardar errorText pendiente si existe (para DiagnoseIntent)
-            error_text = None
-            try:
-                slots = handler_input.request_envelope.request.intent.slots
-                if slots and 'errorText' in slots and slots['errorText'].value:
-                    error_text = slots['errorText'].value
-                    # Guardar en sesion para procesarlo despues
-                    self.set_session_attribute(
-                        handler_input, 'pending_error_text', error_text)
-            except Exception as e:
-                self.logger.warning(
-                    f"Error getting pending error text: {str(e)}")
+            error_text = _get_slot_value(handler_input, 'errorText')
+            if error_text:
+                # Guardar en sesion para procesarlo despues
+                self.set_session_attribute(
+                    handler_input, 'pending_error_text', error_text)
 
             speak_output = (
                 "Primero necesito que configures tu perfil. "
@@ -680,20 +897,23 @@ def log_execution_time(func):
     """
     Decorador que registra el tiempo de ejecucion de un handler.
 
-    Usa el singleton LoggerManager para logging consistente.
+    Usa el singleton LoggerManager para logging consistente. Mide con un
+    reloj monotonico y no arma el log si INFO no esta habilitado.
     """
-    import time
+    # Resueltos una vez al decorar, no en cada request
+    logger_mgr = get_logger_manager()
+    perf_logger = logger_mgr.get_logger('performance')
 
     def wrapper(self, handler_input: HandlerInput) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         response = func(self, handler_input)
 
-        duration = time.time() - start_time
-        duration_ms = duration * 1000
+        if not perf_logger.isEnabledFor(logging.INFO):
+            return response
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-        # Usar singleton centralizado para logging
-        logger_mgr = get_logger_manager()
         logger_mgr.info(
             f"Execution completed",
             context={
@@ -705,7 +925,7 @@ def log_execution_time(func):
 
         # Actualizar log de response con duration
         try:
-            has_card = hasattr(response, 'card') and response.card is not None
+            has_card = getattr(response, 'card', None) is not None
             should_end = response.should_end_session
             logger_mgr.log_response(
                 intent_name=self.intent_name,
@@ -713,7 +933,7 @@ def log_execution_time(func):
                 should_end=should_end,
                 duration_ms=duration_ms
             )
-        except:
+        except Exception:
             pass
 
         return response
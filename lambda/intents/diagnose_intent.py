@@ -17,6 +17,8 @@ Patterns:
 - Builder (construccion de respuesta)
 """
 
+import logging
+
 from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_model import Response
 
@@ -28,7 +30,7 @@ from core.response_builder import AlexaResponseBuilder
 from core.diagnostic_strategies import create_default_strategy_chain
 from core.factories import DiagnosticFactory
 
-from config.settings import MAX_VOICE_LENGTH, KB_CONFIDENCE_THRESHOLD, MAX_CARD_LENGTH
+from config.settings import MAX_VOICE_LENGTH
 
 
 class DiagnoseIntentHandler(BaseIntentHandler):
@@ -57,21 +59,6 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         - errorText: Descripcion del error (AMAZON.SearchQuery)
     """
 
-    @property
-    def MAX_VOICE_LENGTH(self):
-        """Obtiene longitud maxima de voz desde settings."""
-        return MAX_VOICE_LENGTH
-
-    @property
-    def MAX_CARD_LENGTH(self):
-        """Obtiene longitud maxima de card desde settings."""
-        return MAX_CARD_LENGTH
-
-    @property
-    def CONFIDENCE_THRESHOLD(self):
-        """Obtiene umbral de confianza desde settings."""
-        return KB_CONFIDENCE_THRESHOLD
-
     def __init__(self):
         """Inicializa el handler con cadena de estrategias."""
         super().__init__()
@@ -79,6 +66,10 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         # Strategy Pattern: Cadena de estrategias de diagnostico
         self.strategy_chain = create_default_strategy_chain()
 
+        # Cargar KB y crear clientes durante el init de Lambda, no en el
+        # primer request
+        self.strategy_chain.warmup()
+
         self.logger.info(
             "DiagnoseIntentHandler initialized")
 
@@ -111,13 +102,14 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         # Obtener perfil de usuario
         user_profile = self.get_user_profile(handler_input)
 
-        self.logger.info(
-            "Processing diagnostic request",
-            extra={
-                'error_text': error_text[:50],
-                'user_os': user_profile.os.value
-            }
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Processing diagnostic request",
+                extra={
+                    'error_text': error_text[:50],
+                    'user_os': user_profile.os_key
+                }
+            )
 
         # Generar diagnostico
         diagnostic = self._generate_diagnostic(error_text, user_profile)
@@ -148,6 +140,7 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         Genera diagnostico usando Strategy Pattern con Chain of Responsibility.
 
         Delega la busqueda a la cadena de estrategias que ejecuta:
+        0. InProcessCacheStrategy (memoria del contenedor, sin red)
         1. KnowledgeBaseStrategy (rapido, gratis, preciso)
         2. CachedAIDiagnosticStrategy (rapido, gratis, reutiliza)
         3. LiveAIDiagnosticStrategy (lento, costoso, flexible + cache)
@@ -159,7 +152,9 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         Returns:
             Diagnostic con informacion completa del error
         """
-        self.logger.debug(f"Generating diagnostic for: {error_text[:30]}...")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Generating diagnostic for: %s...", error_text[:30])
 
         # Ejecutar cadena de estrategias
         diagnostic = self.strategy_chain.search_diagnostic(
@@ -210,7 +205,7 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         voice_text = sanitize_ssml_text(diagnostic.voice_text or "")
         voice_text = truncate_text(
             voice_text,
-            max_length=self.MAX_VOICE_LENGTH
+            max_length=MAX_VOICE_LENGTH
         )
 
         # Anhadir prompt para follow-up
@@ -218,16 +213,17 @@ class DiagnoseIntentHandler(BaseIntentHandler):
             " Quieres saber por que ocurre esto o necesitas mas opciones?"
         )
 
-        # Log del diagnostico
-        self.logger_manager.log_diagnostic(
-            error_type=diagnostic.error_type,
-            confidence=diagnostic.confidence,
-            source=diagnostic.source
-        )
+        # Log del diagnostico (sin armar contextos si INFO no esta activo)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger_manager.log_diagnostic(
+                error_type=diagnostic.error_type,
+                confidence=diagnostic.confidence,
+                source=diagnostic.source
+            )
 
-        self.logger.info(f"Voice text to speak: '{voice_text[:100]}...'")
-        self.logger.info(
-            f"Voice text length: {len(voice_text)} characters")
+            self.logger.info("Voice text to speak: '%s...'", voice_text[:100])
+            self.logger.info(
+                "Voice text length: %d characters", len(voice_text))
 
         # Sanitizar card content tambien
         card_content = sanitize_ssml_text(diagnostic.card_text or "")
@@ -287,10 +283,11 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         Returns:
             Response solicitando mas detalles
         """
-        self.logger.info(
-            "Vague error description provided",
-            extra={'error_text': error_text[:50]}
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Vague error description provided",
+                extra={'error_text': error_text[:50]}
+            )
 
         speak_output = (
             "Entiendo que tienes un error, pero necesito mas detalles especificos. "
@@ -304,8 +301,8 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         )
 
         # Mantener flag para capturar la respuesta
-        session_attr = handler_input.attributes_manager.session_attributes
-        session_attr['awaiting_error_description'] = True
+        self.set_session_attribute(
+            handler_input, 'awaiting_error_description', True)
 
         return (
             handler_input.response_builder
@@ -326,8 +323,8 @@ class DiagnoseIntentHandler(BaseIntentHandler):
         """
         self.logger.warning("DiagnoseIntent called without errorText slot")
 
-        session_attr = handler_input.attributes_manager.session_attributes
-        session_attr['awaiting_error_description'] = True
+        self.set_session_attribute(
+            handler_input, 'awaiting_error_description', True)
 
         speak_output = (
             "Claro, puedo ayudarte con tu codigo. "
@@ -25,7 +25,7 @@ from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_model import Response
 from ask_sdk_model.ui import SimpleCard
 
-from core.diagnostic_strategies import create_default_strategy_chain
+from core.diagnostic_strategies import default_search_diagnostic
 from core.factories import DiagnosticFactory
 from intents.base import BaseIntentHandler
 from models import UserProfile, OperatingSystem, PackageManager, Editor, ErrorType
@@ -393,9 +393,8 @@ class SetProfileIntentHandler(BaseIntentHandler):
         Returns:
             Diagnostic object
         """
-        # Usar Strategy Pattern
-        strategy_chain = create_default_strategy_chain()
-        diagnostic = strategy_chain.search_diagnostic(error_text, profile)
+        # Usar Strategy Pattern (cadena por defecto compartida)
+        diagnostic = default_search_diagnostic(error_text, profile)
 
         # Fallback si todas las estrategias fallan
         if not diagnostic:
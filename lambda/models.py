@@ -6,9 +6,11 @@ para proporcionar type safety y validacion.
 """
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from functools import cached_property, lru_cache
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from enum import Enum
 
 
@@ -138,13 +140,14 @@ class Editor(Enum):
         return mapping.get(normalized, cls.UNKNOWN)
 
 
-@dataclass
+@dataclass(frozen=True)
 class UserProfile:
     """
     Perfil tecnico del usuario.
 
     Contiene las preferencias del usuario para personalizar
-    las soluciones de diagnostico.
+    las soluciones de diagnostico. Es inmutable: update() retorna
+    un perfil nuevo, por lo que las instancias pueden compartirse.
 
     Attributes:
         os: Sistema operativo
@@ -206,6 +209,31 @@ class UserProfile:
             'is_configured': self.is_configured
         }
 
+    @cached_property
+    def os_key(self) -> str:
+        """Valor string del OS (clave en el KB), resuelto una sola vez."""
+        return self.os.value
+
+    @cached_property
+    def pm_key(self) -> str:
+        """Valor string del package manager, resuelto una sola vez."""
+        return self.package_manager.value
+
+    @cached_property
+    def cache_key(self) -> str:
+        """
+        Clave del perfil para caches de diagnosticos ("os:pm").
+
+        Solo OS y package manager cambian las soluciones cacheadas; el
+        perfil no se modifica dentro de un request (update() retorna un
+        perfil nuevo), asi que la clave se calcula una sola vez.
+
+        Example:
+            >>> UserProfile().cache_key
+            'linux:pip'
+        """
+        return f"{self.os_key}:{self.pm_key}"
+
     def update(self, **kwargs) -> 'UserProfile':
         """
         Actualiza perfil con nuevos valores.
@@ -239,6 +267,24 @@ class UserProfile:
         return UserProfile.from_dict(current)
 
 
+def intern_label(value: Any) -> Any:
+    """
+    Interna etiquetas de conjunto cerrado (error_type, source).
+
+    Los valores que llegan de JSON (KB, IA, sesion, DynamoDB) son strings
+    nuevos en cada request; internados, las comparaciones y busquedas en
+    dicts se resuelven por identidad. Los valores que no son str se
+    retornan sin cambios.
+
+    Args:
+        value: Etiqueta a internar
+
+    Returns:
+        La etiqueta internada (o el valor original si no es str)
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class Diagnostic:
     """
@@ -258,17 +304,20 @@ class Diagnostic:
         source: Fuente del diagnostico
         common_causes: Causas comunes del error
         related_errors: Errores relacionados
+
+    Las secuencias pueden ser tuplas compartidas (clones de templates):
+    no se modifican in-place, se reemplazan.
     """
     error_type: str
     voice_text: str
     card_title: str
     card_text: str
-    solutions: List[str] = field(default_factory=list)
+    solutions: Sequence[str] = field(default_factory=list)
     explanation: Optional[str] = None
     confidence: float = 0.0
     source: str = DiagnosticSource.UNKNOWN.value
-    common_causes: List[str] = field(default_factory=list)
-    related_errors: List[str] = field(default_factory=list)
+    common_causes: Sequence[str] = field(default_factory=list)
+    related_errors: Sequence[str] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Diagnostic':
@@ -292,14 +341,15 @@ class Diagnostic:
             ... })
         """
         return cls(
-            error_type=data.get('error_type', 'unknown'),
+            error_type=intern_label(data.get('error_type', 'unknown')),
             voice_text=data.get('voice_text', ''),
             card_title=data.get('card_title', ''),
             card_text=data.get('card_text', ''),
             solutions=data.get('solutions', []),
             explanation=data.get('explanation'),
             confidence=data.get('confidence', 0.0),
-            source=data.get('source', DiagnosticSource.UNKNOWN.value),
+            source=intern_label(
+                data.get('source', DiagnosticSource.UNKNOWN.value)),
             common_causes=data.get('common_causes', []),
             related_errors=data.get('related_errors', [])
         )
@@ -324,6 +374,30 @@ class Diagnostic:
             'related_errors': self.related_errors
         }
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Diagnostic':
+        """
+        Copia profunda directa: los campos son escalares inmutables y
+        listas planas de strings, no hace falta la maquinaria de deepcopy.
+
+        Args:
+            memo: Memo de copy.deepcopy (no se usa)
+
+        Returns:
+            Nuevo Diagnostic independiente del original
+        """
+        return Diagnostic(
+            error_type=self.error_type,
+            voice_text=self.voice_text,
+            card_title=self.card_title,
+            card_text=self.card_text,
+            solutions=list(self.solutions),
+            explanation=self.explanation,
+            confidence=self.confidence,
+            source=self.source,
+            common_causes=list(self.common_causes),
+            related_errors=list(self.related_errors)
+        )
+
     def get_error_type_enum(self) -> ErrorType:
         """
         Obtiene ErrorType enum del tipo de error.
@@ -504,9 +578,11 @@ class ErrorPattern(ABC):
 class PythonExceptionPattern(ErrorPattern):
     """Detecta nombres de excepciones Python estandar (NombreError, NombreException)."""
 
+    # CamelCase terminando en Error o Exception
+    _REGEX = re.compile(r'[A-Z][a-z]+(?:Error|Exception)')
+
     def matches(self, text: str) -> bool:
-        # CamelCase terminando en Error o Exception
-        return bool(re.search(r'[A-Z][a-z]+(?:Error|Exception)', text))
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.3
@@ -515,8 +591,10 @@ class PythonExceptionPattern(ErrorPattern):
 class NotFoundPattern(ErrorPattern):
     """Detecta frases 'not found' comunes en errores."""
 
+    _REGEX = re.compile(r'\bnot found\b', re.IGNORECASE)
+
     def matches(self, text: str) -> bool:
-        return bool(re.search(r'\bnot found\b', text, re.IGNORECASE))
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.2
@@ -525,8 +603,10 @@ class NotFoundPattern(ErrorPattern):
 class CannotActionPattern(ErrorPattern):
     """Detecta frases 'cannot do_something'."""
 
+    _REGEX = re.compile(r'\bcannot \w+', re.IGNORECASE)
+
     def matches(self, text: str) -> bool:
-        return bool(re.search(r'\bcannot \w+', text, re.IGNORECASE))
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.2
@@ -535,13 +615,15 @@ class CannotActionPattern(ErrorPattern):
 class ModuleImportPattern(ErrorPattern):
     """Detecta errores relacionados con imports/modulos."""
 
+    _REGEX = re.compile(
+        r'\bno module named\b'
+        r'|\bimport\b'
+        r'|\bmodule\b.*\berror\b',
+        re.IGNORECASE
+    )
+
     def matches(self, text: str) -> bool:
-        patterns = [
-            r'\bno module named\b',
-            r'\bimport\b',
-            r'\bmodule\b.*\berror\b'
-        ]
-        return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.25
@@ -550,13 +632,15 @@ class ModuleImportPattern(ErrorPattern):
 class SyntaxRelatedPattern(ErrorPattern):
     """Detecta errores de sintaxis."""
 
+    _REGEX = re.compile(
+        r'\binvalid syntax\b'
+        r'|\bsyntax error\b'
+        r'|\bexpected.*but found\b',
+        re.IGNORECASE
+    )
+
     def matches(self, text: str) -> bool:
-        patterns = [
-            r'\binvalid syntax\b',
-            r'\bsyntax error\b',
-            r'\bexpected.*but found\b'
-        ]
-        return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.25
@@ -565,13 +649,15 @@ class SyntaxRelatedPattern(ErrorPattern):
 class AttributeAccessPattern(ErrorPattern):
     """Detecta errores de atributos."""
 
+    _REGEX = re.compile(
+        r'\bhas no attribute\b'
+        r'|\bnot defined\b'
+        r'|\bundefined\b',
+        re.IGNORECASE
+    )
+
     def matches(self, text: str) -> bool:
-        patterns = [
-            r'\bhas no attribute\b',
-            r'\bnot defined\b',
-            r'\bundefined\b'
-        ]
-        return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.2
@@ -580,14 +666,15 @@ class AttributeAccessPattern(ErrorPattern):
 class TechnicalNotationPattern(ErrorPattern):
     """Detecta notacion tecnica (package.module, snake_case, etc.)."""
 
+    _REGEX = re.compile(
+        r'\w+\.\w+'             # package.module
+        r'|[a-z]+_[a-z]+'       # snake_case
+        r'|[a-z]+-[a-z]+'       # kebab-case
+        r'|\w+\d+'              # con numeros
+    )
+
     def matches(self, text: str) -> bool:
-        patterns = [
-            r'\w+\.\w+',           # package.module
-            r'[a-z]+_[a-z]+',      # snake_case
-            r'[a-z]+-[a-z]+',      # kebab-case
-            r'\w+\d+',             # con numeros
-        ]
-        return any(re.search(p, text.lower()) for p in patterns)
+        return self._REGEX.search(text.lower()) is not None
 
     def get_confidence(self) -> float:
         return 0.15
@@ -596,13 +683,15 @@ class TechnicalNotationPattern(ErrorPattern):
 class TracebackPattern(ErrorPattern):
     """Detecta menciones de traceback o lineas de codigo."""
 
+    _REGEX = re.compile(
+        r'\btraceback\b'
+        r'|\bline \d+\b'
+        r'|\bfile ".*", line \d+\b',
+        re.IGNORECASE
+    )
+
     def matches(self, text: str) -> bool:
-        patterns = [
-            r'\btraceback\b',
-            r'\bline \d+\b',
-            r'\bfile ".*", line \d+\b'
-        ]
-        return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+        return self._REGEX.search(text) is not None
 
     def get_confidence(self) -> float:
         return 0.2
@@ -785,6 +874,7 @@ class ErrorValidator:
             rules: Lista de reglas a aplicar. Si None, usa reglas por defecto.
         """
         self._rules = rules or self._get_default_rules()
+        self._pattern_matcher = ErrorPatternMatcher()
 
     @staticmethod
     def _get_default_rules() -> List[ValidationRule]:
@@ -796,25 +886,40 @@ class ErrorValidator:
             PatternBasedRule(),
         ]
 
-    def validate(self, text: str) -> ValidationResult:
+    def check(self, text: str) -> Optional[ValidationResult]:
         """
-        Valida el texto aplicando todas las reglas en orden.
+        Aplica las reglas en orden sin calcular el score final.
 
         Args:
             text: Descripcion del error a validar
 
         Returns:
-            ValidationResult con el resultado de la primera regla que falle,
-            o ValidationResult valido si todas pasan.
+            ValidationResult de la primera regla que falle, o None si
+            todas pasan.
         """
         for rule in self._rules:
             result = rule.validate(text)
             if not result.is_valid:
                 return result
+        return None
+
+    def validate(self, text: str) -> ValidationResult:
+        """
+        Valida el texto aplicando todas las reglas en orden.
+
+        Args:
+            text: Descripcion del error a validar
+
+        Returns:
+            ValidationResult con el resultado de la primera regla que falle,
+            o ValidationResult valido si todas pasan.
+        """
+        failure = self.check(text)
+        if failure is not None:
+            return failure
 
         # Todas las reglas pasaron - calcular score final
-        pattern_matcher = ErrorPatternMatcher()
-        score = pattern_matcher.calculate_confidence_score(text)
+        score = self._pattern_matcher.calculate_confidence_score(text)
         return ValidationResult(is_valid=True, score=score)
 
 
@@ -836,11 +941,15 @@ class ErrorValidation:
         return cls._validator
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def is_specific_enough(cls, text: str) -> Tuple[bool, Optional[str]]:
         """
         Valida si la descripcion del error es suficientemente especifica.
 
-        Mantiene la interfaz original para compatibilidad.
+        Mantiene la interfaz original para compatibilidad. No calcula el
+        score (ver get_specificity_score) y memoiza el resultado: las
+        descripciones vagas ("error", "no funciona") se repiten entre
+        usuarios.
 
         Args:
             text: Descripcion del error
@@ -855,9 +964,10 @@ class ErrorValidation:
             >>> ErrorValidation.is_specific_enough("numpy not found")
             (True, None)
         """
-        validator = cls._get_validator()
-        result = validator.validate(text)
-        return (result.is_valid, result.message)
+        failure = cls._get_validator().check(text)
+        if failure is None:
+            return (True, None)
+        return (False, failure.message)
 
     @classmethod
     def get_specificity_score(cls, text: str) -> float:
@@ -25,7 +25,7 @@ from .ai_client import (
     AIProviderUnavailable
 )
 
-from config.settings import AIProvider
+from config.settings import AI_PROVIDERS
 
 from .storage import (
     StorageService,
@@ -51,7 +51,7 @@ __all__ = [
     'MockAIClient',
     'ai_service',
     'generate_ai_diagnostic',
-    'AIProvider',
+    'AI_PROVIDERS',
     'AIClientError',
     'AIProviderUnavailable',
 
@@ -12,17 +12,25 @@ Patterns:
 """
 
 import json
-from typing import Optional, Dict, Any, List
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from abc import ABC, abstractmethod
 
 import boto3
+from botocore.config import Config
 
-from models import Diagnostic, UserProfile, ErrorType
+from models import (
+    Diagnostic, UserProfile, ErrorType, OperatingSystem, PackageManager
+)
 from core.factories import DiagnosticFactory
 from utils import get_logger
 from config.settings import (
-    BEDROCK_MAX_TOKENS, BEDROCK_TEMPERATURE, OPENAI_MAX_TOKENS,
-    OPENAI_TEMPERATURE, OPENAI_API_KEY, OPENAI_MODEL
+    AI_PROVIDER_CHAIN, AI_PROVIDER_HEDGE_SECONDS, BEDROCK_MAX_TOKENS,
+    BEDROCK_TEMPERATURE, BEDROCK_LATENCY_OPTIMIZED, BEDROCK_MODEL_ID,
+    BEDROCK_REGION, OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE, OPENAI_API_KEY,
+    OPENAI_MODEL
 )
 
 _openai_client = None
@@ -47,6 +55,30 @@ class AIResponseParseError(AIClientError):
     """Error parseando respuesta de IA."""
 
 
+# Prompt del modelo: encabezado + texto del error + cuerpo segun el perfil
+_PROMPT_HEADER = "Error: "
+_PROMPT_BODY_TEMPLATE = """
+Sistema: %(os)s, Gestor: %(pm)s
+
+Responde en JSON:
+{
+"error_type": "NombreDelError",
+"voice_text": "Explicacion clara del error en 2-3 oraciones que se pueda decir en voz alta",
+"solutions": ["Solucion 1 especifica con comando para %(os)s y %(pm)s", "Solucion 2 alternativa"],
+"explanation": "Explicacion tecnica breve",
+"common_causes": ["Causa comun 1", "Causa comun 2"]
+}"""
+
+# Cuerpos ya formateados para cada combinacion (OS, package manager)
+_PROMPT_BODIES = {
+    (os_item.value, pm_item.value): _PROMPT_BODY_TEMPLATE % {
+        'os': os_item.value, 'pm': pm_item.value
+    }
+    for os_item in OperatingSystem
+    for pm_item in PackageManager
+}
+
+
 class BaseAIClient(ABC):
     """
     Cliente base para servicios de IA.
@@ -55,6 +87,10 @@ class BaseAIClient(ABC):
     Pattern: Strategy + Template Method
     """
 
+    # False para providers de ultimo recurso: solo se llaman cuando los
+    # anteriores terminaron sin resultado o vencio el deadline del hedge
+    hedgeable = True
+
     def __init__(self):
         """Inicializa el cliente."""
         self.logger = get_logger(self.__class__.__name__)
@@ -105,17 +141,11 @@ class BaseAIClient(ABC):
         pm_val = user_profile.package_manager.value if hasattr(
             user_profile.package_manager, 'value') else str(user_profile.package_manager)
 
-        return f"""Error: {error_text}
-Sistema: {os_val}, Gestor: {pm_val}
+        body = _PROMPT_BODIES.get((os_val, pm_val))
+        if body is None:
+            body = _PROMPT_BODY_TEMPLATE % {'os': os_val, 'pm': pm_val}
 
-Responde en JSON:
-{{
-"error_type": "NombreDelError",
-"voice_text": "Explicacion clara del error en 2-3 oraciones que se pueda decir en voz alta",
-"solutions": ["Solucion 1 especifica con comando para {os_val} y {pm_val}", "Solucion 2 alternativa"],
-"explanation": "Explicacion tecnica breve",
-"common_causes": ["Causa comun 1", "Causa comun 2"]
-}}"""
+        return _PROMPT_HEADER + error_text + body
 
     def _parse_ai_response(
         self,
@@ -159,6 +189,21 @@ Responde en JSON:
             raise AIResponseParseError(f"Invalid JSON: {e}")
 
 
+# Cliente de Bedrock acotado al presupuesto de 8s de Alexa: un solo intento
+# (sin reintentos de botocore), asi una llamada bloquea como maximo
+# connect_timeout + read_timeout = 6s. Conexiones keep-alive reutilizadas
+# entre invocaciones warm
+_BEDROCK_CLIENT_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=5,
+    retries={'total_max_attempts': 1, 'mode': 'standard'},
+    tcp_keepalive=True
+)
+
+# Familias de modelos de Bedrock con inferencia optimizada para latencia
+_LATENCY_OPTIMIZED_MODELS = ('claude-3-5-haiku', 'nova-pro')
+
+
 class BedrockAIClient(BaseAIClient):
     """
     Cliente para AWS Bedrock.
@@ -169,7 +214,8 @@ class BedrockAIClient(BaseAIClient):
     def __init__(
         self,
         model_id: str = "anthropic.claude-3-haiku-20240307-v1:0",
-        region: str = "us-east-1"
+        region: str = "us-east-1",
+        latency_optimized: Optional[bool] = None
     ):
         """
         Inicializa cliente Bedrock.
@@ -177,12 +223,25 @@ class BedrockAIClient(BaseAIClient):
         Args:
             model_id: ID del modelo en Bedrock
             region: Region de AWS
+            latency_optimized: Pedir inferencia optimizada para latencia
+                (default: BEDROCK_LATENCY_OPTIMIZED). Solo se aplica a
+                modelos compatibles.
         """
         super().__init__()
         self.model_id = model_id
         self.region = region
         self._client = None
 
+        if latency_optimized is None:
+            latency_optimized = BEDROCK_LATENCY_OPTIMIZED
+
+        # Parametros fijos de invoke_model, resueltos una sola vez
+        self._invoke_kwargs: Dict[str, Any] = {'modelId': model_id}
+        if latency_optimized and any(
+            family in model_id for family in _LATENCY_OPTIMIZED_MODELS
+        ):
+            self._invoke_kwargs['performanceConfigLatency'] = 'optimized'
+
     def _get_client(self):
         """
         Obtiene cliente de Bedrock (lazy initialization).
@@ -194,7 +253,8 @@ class BedrockAIClient(BaseAIClient):
             try:
                 self._client = boto3.client(
                     service_name='bedrock-runtime',
-                    region_name=self.region
+                    region_name=self.region,
+                    config=_BEDROCK_CLIENT_CONFIG
                 )
             except Exception as e:
                 self.logger.error(f"Failed to create Bedrock client: {e}")
@@ -235,8 +295,8 @@ class BedrockAIClient(BaseAIClient):
 
             # Invocar modelo
             response = client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body)
+                body=json.dumps(request_body),
+                **self._invoke_kwargs
             )
 
             # Parsear respuesta
@@ -343,6 +403,8 @@ class MockAIClient(BaseAIClient):
     Genera diagnosticos basados en patrones sin llamar a servicios externos.
     """
 
+    hedgeable = False
+
     def is_available(self) -> bool:
         """Mock siempre esta disponible."""
         return True
@@ -362,35 +424,96 @@ class MockAIClient(BaseAIClient):
         )
 
 
+# Executor de las llamadas a providers cuando hay hedge; reutilizado entre
+# invocaciones warm. Con margen de workers: una llamada abandonada por el
+# hedge sigue ocupando su thread (en segundo plano, sin bloquear la
+# respuesta) hasta que vence el timeout de su cliente
+_provider_executor = ThreadPoolExecutor(
+    max_workers=4,
+    thread_name_prefix='ai-provider'
+)
+
+# Presupuesto total de los providers con hedge, desde el primer lanzamiento.
+# Deja margen dentro de los 8s de Alexa para el fallback y la respuesta
+_AI_DEADLINE_SECONDS = 6.0
+
+
+def _build_providers(chain: Sequence[str]) -> List[BaseAIClient]:
+    """
+    Crea los providers de AI_PROVIDER_CHAIN.
+
+    Cada entrada es "bedrock[:<model_id>]", "openai[:<modelo>]" o "mock";
+    sin modelo se usan BEDROCK_MODEL_ID / OPENAI_MODEL.
+
+    Args:
+        chain: Entradas de la cadena en orden de preferencia
+
+    Returns:
+        Lista de providers (vacia si la cadena esta vacia)
+    """
+    providers: List[BaseAIClient] = []
+    for spec in chain:
+        name, _, model = spec.partition(':')
+        if name == 'bedrock':
+            providers.append(BedrockAIClient(
+                model_id=model or BEDROCK_MODEL_ID, region=BEDROCK_REGION))
+        elif name == 'openai':
+            providers.append(OpenAIClient(
+                api_key=OPENAI_API_KEY, model=model or OPENAI_MODEL))
+        elif name == 'mock':
+            providers.append(MockAIClient())
+    return providers
+
+
 class AIService:
     """
     Servicio principal de IA con fallback chain.
 
-    Intenta providers en orden hasta obtener respuesta exitosa.
+    Intenta providers en orden hasta obtener respuesta exitosa. Con mas de
+    un provider `hedgeable`, si uno no responde dentro de `hedge_after`
+    segundos el siguiente se lanza en paralelo y gana la primera respuesta
+    valida. Los providers no `hedgeable` (mock) son el ultimo recurso: se
+    llaman en el thread del request cuando los demas fallan o vence
+    `deadline`. Las llamadas perdedoras no se esperan.
     Pattern: Chain of Responsibility + Facade
     """
 
     def __init__(
         self,
-        providers: Optional[List[BaseAIClient]] = None
+        providers: Optional[List[BaseAIClient]] = None,
+        hedge_after: Optional[float] = None,
+        deadline: float = _AI_DEADLINE_SECONDS
     ):
         """
         Inicializa servicio de IA.
 
         Args:
             providers: Lista de providers en orden de preferencia
+                (default: AI_PROVIDER_CHAIN, o OpenAI y luego mock)
+            hedge_after: Segundos de espera por provider antes de lanzar el
+                siguiente (default: AI_PROVIDER_HEDGE_SECONDS)
+            deadline: Segundos totales para los providers con hedge antes
+                de pasar al fallback
         """
         self.logger = get_logger(self.__class__.__name__)
+        self.hedge_after = (
+            AI_PROVIDER_HEDGE_SECONDS if hedge_after is None else hedge_after
+        )
+        self.deadline = deadline
 
         if providers:
             self.providers = providers
         else:
             # Configuracion por defecto: intentar OpenAI, luego mock
-            self.providers = [
+            self.providers = _build_providers(AI_PROVIDER_CHAIN) or [
                 OpenAIClient(api_key=OPENAI_API_KEY, model=OPENAI_MODEL),
                 MockAIClient(),
             ]
 
+        # Sin dos providers que puedan competir, el hedge nunca se activa:
+        # se llama a cada provider en el thread del request
+        self._hedged = sum(p.hedgeable for p in self.providers) > 1
+
     def generate_diagnostic(
         self,
         error_text: str,
@@ -409,36 +532,147 @@ class AIService:
         self.logger.info(
             f"Generating AI diagnostic with {len(self.providers)} providers")
 
-        for provider in self.providers:
-            provider_name = provider.__class__.__name__
+        if not self._hedged:
+            return self._generate_sequential(
+                self.providers, error_text, user_profile)
+
+        remaining = deque(self.providers)
+        running: Dict[Future, str] = {}
+
+        def launch_next() -> bool:
+            """Lanza el siguiente provider con hedge; False si no hay."""
+            while remaining and remaining[0].hedgeable:
+                provider = remaining.popleft()
+                provider_name = provider.__class__.__name__
+
+                # Verificar disponibilidad
+                if not provider.is_available():
+                    self.logger.warning(
+                        f"{provider_name} not available, skipping")
+                    continue
+
+                future = _provider_executor.submit(
+                    provider.generate_diagnostic, error_text, user_profile)
+                running[future] = provider_name
+                return True
+            return False
 
-            # Verificar disponibilidad
-            if not provider.is_available():
-                self.logger.warning(f"{provider_name} not available, skipping")
+        deadline = time.monotonic() + self.deadline
+        launch_next()
+
+        while running:
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                break
+
+            done, _ = wait(
+                running, timeout=min(self.hedge_after, time_left),
+                return_when=FIRST_COMPLETED
+            )
+
+            if not done:
+                # Sin respuesta a tiempo: competir con el siguiente provider
+                if time.monotonic() < deadline and launch_next():
+                    self.logger.warning(
+                        f"AI provider exceeded {self.hedge_after}s, "
+                        f"hedging with {list(running.values())[-1]}"
+                    )
                 continue
 
-            try:
-                diagnostic = provider.generate_diagnostic(
-                    error_text, user_profile)
+            for future in done:
+                provider_name = running.pop(future)
+                diagnostic = self._provider_result(
+                    future.result, provider_name)
                 if diagnostic:
-                    self.logger.info(
-                        f"Diagnostic generated via {provider_name}")
+                    # Las que ya corren terminan en segundo plano
+                    for pending in running:
+                        pending.cancel()
                     return diagnostic
 
-            except AIProviderUnavailable as e:
-                self.logger.warning(f"{provider_name} unavailable: {e}")
-                continue
-            except AIClientError as e:
-                self.logger.error(f"{provider_name} error: {e}")
-                continue
-            except Exception as e:
-                self.logger.error(
-                    f"Unexpected error with {provider_name}: {e}", exc_info=True)
+            if not running:
+                launch_next()
+
+        if running:
+            self.logger.warning(
+                f"AI providers exceeded {self.deadline}s deadline: "
+                f"{', '.join(running.values())}"
+            )
+            for pending in running:
+                pending.cancel()
+
+        # Ultimo recurso: providers sin hedge, en el thread del request
+        return self._generate_sequential(
+            [p for p in remaining if not p.hedgeable],
+            error_text, user_profile
+        )
+
+    def _generate_sequential(
+        self,
+        providers: List[BaseAIClient],
+        error_text: str,
+        user_profile: UserProfile
+    ) -> Optional[Diagnostic]:
+        """
+        Intenta providers uno tras otro en el thread actual (sin hedge).
+
+        Args:
+            providers: Providers a intentar, en orden
+            error_text: Texto del error
+            user_profile: Perfil del usuario
+
+        Returns:
+            Diagnostic o None si todos fallan
+        """
+        for provider in providers:
+            provider_name = provider.__class__.__name__
+
+            if not provider.is_available():
+                self.logger.warning(f"{provider_name} not available, skipping")
                 continue
 
+            diagnostic = self._provider_result(
+                lambda: provider.generate_diagnostic(error_text, user_profile),
+                provider_name
+            )
+            if diagnostic:
+                return diagnostic
+
         self.logger.error("All AI providers failed")
         return None
 
+    def _provider_result(
+        self,
+        call: Callable[[], Optional[Diagnostic]],
+        provider_name: str
+    ) -> Optional[Diagnostic]:
+        """
+        Obtiene el diagnostico de una llamada a un provider.
+
+        Args:
+            call: Llamada a generate_diagnostic del provider (o el
+                result() de su future ya terminado)
+            provider_name: Nombre del provider (para logging)
+
+        Returns:
+            Diagnostic o None si el provider fallo
+        """
+        try:
+            diagnostic = call()
+        except AIProviderUnavailable as e:
+            self.logger.warning(f"{provider_name} unavailable: {e}")
+            return None
+        except AIClientError as e:
+            self.logger.error(f"{provider_name} error: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(
+                f"Unexpected error with {provider_name}: {e}", exc_info=True)
+            return None
+
+        if diagnostic:
+            self.logger.info(f"Diagnostic generated via {provider_name}")
+        return diagnostic
+
     def get_available_providers(self) -> List[str]:
         """
         Lista providers disponibles.
@@ -13,14 +13,83 @@ Patterns:
 
 import json
 import re
+import sys
 from typing import Optional, List, Dict, Any, Tuple
-from pathlib import Path
 
+from config.settings import KB_TEMPLATES_PATH
 from models import Diagnostic, UserProfile
 from core.factories import DiagnosticFactory
 from utils import get_logger
 
 
+def _interned_keys_dict(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    object_pairs_hook de json.load que interna las claves.
+
+    Los valores de OperatingSystem/PackageManager ('linux', 'pip', ...)
+    ya estan internados por ser literales del codigo; con las claves del
+    KB internadas, las busquedas solutions[os][pm] se resuelven por
+    identidad sin comparar el contenido del string.
+
+    Args:
+        pairs: Pares (clave, valor) de un objeto JSON
+
+    Returns:
+        Dict[str, Any]: Diccionario con claves internadas
+    """
+    return {sys.intern(key): value for key, value in pairs}
+
+
+class _IndexedTemplate:
+    """
+    Template del KB con los datos de busqueda preparados al cargar.
+
+    Guarda error_type/keywords ya normalizados y los patterns compilados,
+    para que el scoring de cada request no repita ese trabajo.
+    """
+
+    __slots__ = (
+        'template', 'error_type', 'error_type_lower', 'error_type_normalized',
+        'error_base', 'patterns', 'pattern_count', 'keywords',
+        'confidence_boost'
+    )
+
+    def __init__(self, template: Dict[str, Any], logger):
+        """
+        Args:
+            template: Template de error de la KB
+            logger: Logger para reportar patterns invalidos
+        """
+        self.template = template
+
+        error_type = template.get('error_type', '')
+        error_type_lower = error_type.lower()
+        self.error_type = error_type
+        self.error_type_lower = error_type_lower
+        self.error_type_normalized = error_type_lower.replace(
+            ' ', '').replace('_', '')
+        self.error_base = error_type_lower.replace('error', '').strip()
+
+        # Los patterns invalidos se descartan, pero siguen contando en el
+        # total (mismo peso relativo que antes)
+        patterns = template.get('patterns', [])
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(
+                    (pattern, re.compile(pattern, re.IGNORECASE)))
+            except re.error:
+                logger.warning(f"Invalid regex pattern: {pattern}")
+        self.patterns = tuple(compiled)
+        self.pattern_count = len(patterns)
+
+        self.keywords = tuple(
+            (keyword, keyword.lower())
+            for keyword in template.get('keywords', [])
+        )
+        self.confidence_boost = template.get('confidence_boost', 0.0)
+
+
 class KnowledgeBaseService:
     """
     Servicio para buscar diagnosticos en la base de conocimiento local.
@@ -42,22 +111,26 @@ class KnowledgeBaseService:
         """Inicializa el servicio."""
         self.logger = get_logger(self.__class__.__name__)
         self._kb_data: Optional[Dict[str, Any]] = None
+        self._index: Tuple[_IndexedTemplate, ...] = ()
         self._load_knowledge_base()
 
     def _load_knowledge_base(self):
         """
         Carga la base de conocimiento desde JSON.
 
+        La existencia del archivo se verifica aqui, al abrirlo, y no en
+        validate_config(): un solo acceso al filesystem por cold start.
+
         Raises:
             FileNotFoundError: Si kb_templates.json no existe
             json.JSONDecodeError: Si el JSON es invalido
         """
-        try:
-            kb_path = Path(__file__).parent.parent / \
-                'config' / 'kb_templates.json'
+        kb_path = KB_TEMPLATES_PATH
 
+        try:
             with open(kb_path, 'r', encoding='utf-8') as f:
-                self._kb_data = json.load(f)
+                self._kb_data = json.load(
+                    f, object_pairs_hook=_interned_keys_dict)
 
             error_count = len(self._kb_data.get('errors', []))
             self.logger.info(
@@ -70,6 +143,11 @@ class KnowledgeBaseService:
             self.logger.error(f"Invalid JSON in KB file: {e}")
             self._kb_data = {'errors': []}
 
+        self._index = tuple(
+            _IndexedTemplate(template, self.logger)
+            for template in self._kb_data.get('errors', [])
+        )
+
     def search_diagnostic(
         self,
         error_text: str,
@@ -125,15 +203,18 @@ class KnowledgeBaseService:
             Tupla (template, confidence) o None si no hay match
         """
         error_text_lower = error_text.lower()
+        error_text_normalized = error_text_lower.replace(
+            ' ', '').replace('_', '')
         best_match = None
         best_confidence = 0.0
 
-        for template in self._kb_data.get('errors', []):
-            confidence = self._calculate_confidence(template, error_text_lower)
+        for entry in self._index:
+            confidence = self._calculate_confidence(
+                entry, error_text_lower, error_text_normalized)
 
             if confidence > best_confidence:
                 best_confidence = confidence
-                best_match = template
+                best_match = entry.template
 
         # Solo retornar si confidence es suficiente (umbral bajo para capturar mas)
         if best_confidence >= 0.25:  # Umbral minimo reducido
@@ -146,8 +227,9 @@ class KnowledgeBaseService:
 
     def _calculate_confidence(
         self,
-        template: Dict[str, Any],
-        error_text: str
+        entry: _IndexedTemplate,
+        error_text: str,
+        error_text_normalized: str
     ) -> float:
         """
         Calcula confidence score para un template.
@@ -159,71 +241,62 @@ class KnowledgeBaseService:
         - Boost del template: bonus adicional (0.1-0.3 tipicamente)
 
         Args:
-            template: Template de error de la KB
+            entry: Template de error de la KB ya indexado
             error_text: Texto del error (lowercase)
+            error_text_normalized: error_text sin espacios ni '_'
 
         Returns:
             Confidence score entre 0.0 y 1.0
         """
         score = 0.0
-        error_text_normalized = error_text.replace(' ', '').replace('_', '')
 
         # 0. Buscar error_type directamente (alta prioridad)
-        error_type = template.get('error_type', '')
-        if error_type:
-            error_type_lower = error_type.lower()
-            error_type_normalized = error_type_lower.replace(
-                ' ', '').replace('_', '')
+        if entry.error_type:
+            error_base = entry.error_base
 
-            error_base = error_type_lower.replace('error', '').strip()
-
-            if (error_type_lower in error_text or
-                error_type_normalized in error_text_normalized or
+            if (entry.error_type_lower in error_text or
+                entry.error_type_normalized in error_text_normalized or
                     (error_base and error_base in error_text)):
                 score += 0.8
-                self.logger.debug(f"Error type match: {error_type}")
+                self.logger.debug(f"Error type match: {entry.error_type}")
 
-        # 1. Buscar patterns (regex)
-        patterns = template.get('patterns', [])
+        # 1. Buscar patterns (regex precompilados)
+        pattern_count = entry.pattern_count
         pattern_matches = 0
 
-        for pattern in patterns:
-            try:
-                if re.search(pattern, error_text, re.IGNORECASE):
-                    pattern_matches += 1
-                    self.logger.debug(f"Pattern match: {pattern}")
-            except re.error:
-                self.logger.warning(f"Invalid regex pattern: {pattern}")
+        for pattern, regex in entry.patterns:
+            if regex.search(error_text):
+                pattern_matches += 1
+                self.logger.debug(f"Pattern match: {pattern}")
 
         # Cada pattern da mas peso (0.7 puntos, maximo 1.0 con 2+ patterns)
-        if patterns and pattern_matches > 0:
-            score += min(1.0, (pattern_matches / len(patterns)) * 0.7 * 2)
+        if pattern_matches > 0:
+            score += min(1.0, (pattern_matches / pattern_count) * 0.7 * 2)
 
         # 2. Buscar keywords
-        keywords = template.get('keywords', [])
+        keywords = entry.keywords
         keyword_matches = 0
 
-        for keyword in keywords:
-            if keyword.lower() in error_text:
+        for keyword, keyword_lower in keywords:
+            if keyword_lower in error_text:
                 keyword_matches += 1
                 self.logger.debug(f"Keyword match: {keyword}")
 
         # Cada keyword da 0.1 puntos (maximo 0.4 con 4+ keywords)
-        if keywords and keyword_matches > 0:
+        if keyword_matches > 0:
             score += min(0.4, (keyword_matches / len(keywords)) * 0.1 * 4)
 
         # 3. Boost del template
-        confidence_boost = template.get('confidence_boost', 0.0)
-        score += confidence_boost
+        score += entry.confidence_boost
 
         # Normalizar a [0.0, 1.0]
         final_score = min(1.0, score)
 
         if final_score > 0.3:
             self.logger.debug(
-                f"Template {template.get('id')} confidence: {final_score:.2f} "
-                f"(error_type: {error_type.lower() in error_text}, "
-                f"patterns: {pattern_matches}/{len(patterns)}, "
+                f"Template {entry.template.get('id')} confidence: {final_score:.2f} "
+                f"(error_type: {entry.error_type_lower in error_text}, "
+                f"patterns: {pattern_matches}/{pattern_count}, "
                 f"keywords: {keyword_matches}/{len(keywords)})"
             )
 
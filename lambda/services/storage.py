@@ -10,14 +10,17 @@ Patterns:
 - Data Mapper: Mapeo entre objetos de dominio y almacenamiento
 """
 
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 import boto3
 
-from models import UserProfile, Diagnostic, SessionState
-from utils import get_logger
+from models import UserProfile, Diagnostic, SessionState, intern_label
+from utils import get_logger, get_error_hash, utc_now_iso
 from config.settings import (
     ENABLE_STORAGE,
     DYNAMODB_TABLE_NAME,
@@ -45,6 +48,10 @@ class StorageService:
 
     _instance: Optional['StorageService'] = None
 
+    # Cache en memoria de perfiles (invocaciones warm del mismo contenedor)
+    PROFILE_CACHE_MAX_ENTRIES = 512
+    PROFILE_CACHE_TTL_SECONDS = 300
+
     def __new__(cls):
         """Implementa Singleton."""
         if cls._instance is None:
@@ -55,11 +62,39 @@ class StorageService:
     def _initialize(self):
         """Inicializa el servicio."""
         self.logger = get_logger(self.__class__.__name__)
-        self._dynamodb = None
-        self._table = None
+
+        # Recurso y tabla de boto3 por thread: los recursos de boto3 no son
+        # thread-safe y el servicio se usa desde el thread del request y
+        # desde el de escrituras en segundo plano (intents.base)
+        self._local = threading.local()
 
         self.table_name = DYNAMODB_TABLE_NAME
 
+        # user_id -> (timestamp monotonic, perfil o None si no existe)
+        self._profile_cache: 'OrderedDict[str, Tuple[float, Optional[UserProfile]]]' = OrderedDict()
+        # Los guardados de perfil corren en el thread de escrituras
+        # (intents.base) mientras el request lee el cache
+        self._profile_cache_lock = threading.Lock()
+
+    def _cache_profile(
+        self,
+        user_id: str,
+        profile: Optional[UserProfile]
+    ) -> None:
+        """
+        Guarda un perfil en el cache en memoria (LRU con TTL).
+
+        Args:
+            user_id: ID del usuario de Alexa
+            profile: Perfil leido/guardado, o None si el usuario no tiene
+        """
+        with self._profile_cache_lock:
+            self._profile_cache[user_id] = (time.monotonic(), profile)
+            self._profile_cache.move_to_end(user_id)
+
+            if len(self._profile_cache) > self.PROFILE_CACHE_MAX_ENTRIES:
+                self._profile_cache.popitem(last=False)
+
     def _get_table(self):
         """
         Obtiene referencia a tabla DynamoDB (lazy initialization).
@@ -67,10 +102,13 @@ class StorageService:
         Soporta tanto credenciales IAM Role (self-hosted Lambda)
         como credenciales explicitas (Alexa-hosted con DynamoDB externa).
 
+        Cada thread obtiene su propia Session, recurso y tabla.
+
         Returns:
             Tabla de DynamoDB o None si no esta disponible
         """
-        if self._table is None:
+        table = getattr(self._local, 'table', None)
+        if table is None:
             try:
                 # Si storage esta deshabilitado, no intentar conectar
                 if not ENABLE_STORAGE:
@@ -82,7 +120,7 @@ class StorageService:
                     # Conexion con credenciales explicitas
                     self.logger.info(
                         "Using explicit AWS credentials for DynamoDB")
-                    self._dynamodb = boto3.resource(
+                    dynamodb = boto3.session.Session().resource(
                         'dynamodb',
                         region_name=AWS_REGION,
                         aws_access_key_id=EXT_AWS_ACCESS_KEY_ID,
@@ -90,11 +128,12 @@ class StorageService:
                     )
                 else:
                     self.logger.info("Using IAM Role for DynamoDB")
-                    self._dynamodb = boto3.resource(
+                    dynamodb = boto3.session.Session().resource(
                         'dynamodb', region_name=AWS_REGION)
 
                 # Usar nombre de tabla desde settings
-                self._table = self._dynamodb.Table(DYNAMODB_TABLE_NAME)
+                table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+                self._local.table = table
 
                 self.logger.info(
                     f"Connected to DynamoDB table: {DYNAMODB_TABLE_NAME} in region: {AWS_REGION}")
@@ -102,7 +141,7 @@ class StorageService:
                 self.logger.warning(f"DynamoDB no disponible: {e}")
                 return None
 
-        return self._table
+        return table
 
     def is_available(self) -> bool:
         """
@@ -146,13 +185,16 @@ class StorageService:
             item = {
                 'userId': user_id,
                 'profile': profile_data,
-                'updatedAt': datetime.utcnow().isoformat(),
+                'updatedAt': utc_now_iso(),
                 'version': 1
             }
 
             # Guardar
             table.put_item(Item=item)
 
+            # Write-through: las lecturas siguientes no vuelven a DynamoDB
+            self._cache_profile(user_id, profile)
+
             self.logger.info(f"Profile saved for user: {user_id}")
             return True
 
@@ -167,12 +209,25 @@ class StorageService:
         """
         Obtiene perfil de usuario desde DynamoDB.
 
+        Consulta primero el cache en memoria del contenedor; las entradas
+        expiran a los PROFILE_CACHE_TTL_SECONDS para tomar cambios hechos
+        desde otros contenedores.
+
         Args:
             user_id: ID del usuario de Alexa
 
         Returns:
             UserProfile o None si no existe o DynamoDB no disponible
         """
+        with self._profile_cache_lock:
+            cached = self._profile_cache.get(user_id)
+            if cached is not None:
+                cached_at, cached_profile = cached
+                if time.monotonic() - cached_at < self.PROFILE_CACHE_TTL_SECONDS:
+                    self._profile_cache.move_to_end(user_id)
+                    return cached_profile
+                del self._profile_cache[user_id]
+
         try:
             table = self._get_table()
             if table is None:
@@ -194,6 +249,7 @@ class StorageService:
                 # Usuario nuevo, retornar None para que se use perfil por defecto
                 self.logger.info(
                     f"No profile found for user: {user_id}, will use default")
+                self._cache_profile(user_id, None)
                 return None
 
             # Parsear perfil existente
@@ -208,6 +264,7 @@ class StorageService:
             profile_data = self._deserialize_dynamodb(profile_data)
 
             profile = UserProfile.from_dict(profile_data)
+            self._cache_profile(user_id, profile)
 
             self.logger.info(f"Profile loaded for user: {user_id}")
             return profile
@@ -249,7 +306,7 @@ class StorageService:
 
             # Agregar nuevo diagnostico
             diagnostic_entry = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': utc_now_iso(),
                 'errorType': diagnostic.error_type,
                 'source': diagnostic.source,
                 'confidence': Decimal(str(diagnostic.confidence)),
@@ -268,7 +325,7 @@ class StorageService:
                 UpdateExpression='SET diagnosticHistory = :history, updatedAt = :timestamp',
                 ExpressionAttributeValues={
                     ':history': history,
-                    ':timestamp': datetime.utcnow().isoformat()
+                    ':timestamp': utc_now_iso()
                 }
             )
 
@@ -348,7 +405,7 @@ class StorageService:
                 UpdateExpression='SET sessionState = :state, sessionUpdatedAt = :timestamp',
                 ExpressionAttributeValues={
                     ':state': state_data,
-                    ':timestamp': datetime.utcnow().isoformat()
+                    ':timestamp': utc_now_iso()
                 }
             )
 
@@ -507,7 +564,7 @@ class StorageService:
                     'os': profile.os.value,
                     'pm': profile.package_manager.value
                 },
-                'createdAt': datetime.utcnow().isoformat(),
+                'createdAt': utc_now_iso(),
                 'ttl': ttl,
                 'hit_count': 0
             }
@@ -561,13 +618,13 @@ class StorageService:
 
             # Verificar compatibilidad de perfil (OS y PM deben coincidir)
             cached_profile = cache_item.get('profile_context', {})
-            if (cached_profile.get('os') != profile.os.value or
-                    cached_profile.get('pm') != profile.package_manager.value):
+            cached_key = f"{cached_profile.get('os')}:{cached_profile.get('pm')}"
+            if cached_key != profile.cache_key:
                 self.logger.debug(
                     "Cache profile mismatch",
                     extra={
-                        'cached': cached_profile,
-                        'current': {'os': profile.os.value, 'pm': profile.package_manager.value}
+                        'cached': cached_key,
+                        'current': profile.cache_key
                     }
                 )
                 return None
@@ -646,10 +703,11 @@ class StorageService:
         return {
             'error_type': diagnostic.error_type,
             'voice_text': diagnostic.voice_text,
-            'solutions': diagnostic.solutions or [],
+            # list(): boto3 no serializa tuplas (clones de templates)
+            'solutions': list(diagnostic.solutions or ()),
             'explanation': diagnostic.explanation,
-            'common_causes': diagnostic.common_causes or [],
-            'related_errors': diagnostic.related_errors or [],
+            'common_causes': list(diagnostic.common_causes or ()),
+            'related_errors': list(diagnostic.related_errors or ()),
             'confidence': Decimal(str(diagnostic.confidence)),
             'source': diagnostic.source,
             'card_title': diagnostic.card_title,
@@ -667,14 +725,14 @@ class StorageService:
             Diagnostic reconstruido
         """
         return Diagnostic(
-            error_type=data.get('error_type', ''),
+            error_type=intern_label(data.get('error_type', '')),
             voice_text=data.get('voice_text', ''),
             solutions=data.get('solutions'),
             explanation=data.get('explanation'),
             common_causes=data.get('common_causes'),
             related_errors=data.get('related_errors'),
             confidence=float(data.get('confidence', 0.0)),
-            source=data.get('source', ''),
+            source=intern_label(data.get('source', '')),
             card_title=data.get('card_title'),
             card_text=data.get('card_text')
         )
@@ -750,30 +808,3 @@ def save_diagnostic_to_history(user_id: str, diagnostic: Diagnostic) -> bool:
     """
     return storage_service.save_diagnostic_history(user_id, diagnostic)
 
-
-def get_error_hash(error_text: str) -> str:
-    """
-    Genera hash unico para un error normalizado.
-
-    Normaliza el texto del error (lowercase, sin espacios extra)
-    y genera un hash SHA-256 para usar como clave de cache.
-
-    Args:
-        error_text: Texto del error
-
-    Returns:
-        Hash hexadecimal del error
-    """
-    import hashlib
-    import re
-
-    # Normalizar texto
-    normalized = error_text.lower().strip()
-    # Remover espacios multiples
-    normalized = re.sub(r'\s+', ' ', normalized)
-    # Remover caracteres especiales pero mantener espacios
-    normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
-
-    # Generar hash
-    hash_obj = hashlib.sha256(normalized.encode('utf-8'))
-    return hash_obj.hexdigest()
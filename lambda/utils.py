@@ -5,9 +5,13 @@ Este modulo centraliza utilidades compartidas por toda la aplicacion,
 incluyendo el LoggerManager Singleton para logging consistente.
 """
 
+import hashlib
 import logging
+import re
 import sys
 import os
+import time
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -70,10 +74,11 @@ class LoggerManager:
         """
         Configura el logger raiz con formato y handlers.
         """
-        # Formato personalizado con mas informacion
+        # Formato personalizado con mas informacion; el timestamp de cada
+        # log sale del propio record (no hace falta agregarlo en `extra`)
         formatter = logging.Formatter(
             fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%dT%H:%M:%S'
         )
 
         # Handler para stdout
@@ -298,9 +303,15 @@ def get_logger(name: str) -> logging.Logger:
 # Utilidades Generales
 # ============================================================================
 
+# Memo de las transformaciones de texto: los textos de los diagnosticos
+# del KB y de la cache de IA se repiten entre requests
+_TEXT_MEMO_MAX_ENTRIES = 2048
+
+
+@lru_cache(maxsize=_TEXT_MEMO_MAX_ENTRIES)
 def truncate_text(text: str, max_length: int = 300, suffix: str = "...") -> str:
     """
-    Trunca texto a una longitud maxima.
+    Trunca texto a una longitud maxima (memoizado).
 
     Args:
         text: Texto a truncar
@@ -345,9 +356,10 @@ def sanitize_user_data(text: str, keywords: list = None) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=_TEXT_MEMO_MAX_ENTRIES)
 def sanitize_ssml_text(text: str) -> str:
     """
-    Sanitiza texto para uso seguro en SSML de Alexa.
+    Sanitiza texto para uso seguro en SSML de Alexa (memoizado).
 
     Elimina o reemplaza caracteres que pueden romper SSML:
     - & (ampersand) -> 'y'
@@ -377,6 +389,51 @@ def sanitize_ssml_text(text: str) -> str:
     return sanitized
 
 
+# Algoritmos para claves de cache (uso no criptografico)
+_ERROR_HASH_ALGORITHMS = {
+    # blake2b de 16 bytes: mas rapido que SHA-256, 32 caracteres hex
+    'blake2b': lambda data: hashlib.blake2b(data, digest_size=16),
+    'sha256': hashlib.sha256,
+}
+
+
+@lru_cache(maxsize=1)
+def _get_error_hash_algorithm():
+    """Resuelve una sola vez el algoritmo configurado en CACHE_HASH_ALGO."""
+    from config.settings import get_settings
+
+    return _ERROR_HASH_ALGORITHMS[get_settings().cache_hash_algo]
+
+
+def get_error_hash(error_text: str) -> str:
+    """
+    Genera hash unico para un error normalizado.
+
+    Normaliza el texto del error (lowercase, sin espacios extra)
+    y genera un hash (sha256 por defecto, ver CACHE_HASH_ALGO) para
+    usar como clave de cache.
+
+    Args:
+        error_text: Texto del error
+
+    Returns:
+        Hash hexadecimal del error
+
+    Usage:
+        error_hash = get_error_hash("ModuleNotFoundError: No module named x")
+    """
+    # Normalizar texto
+    normalized = error_text.lower().strip()
+    # Remover espacios multiples
+    normalized = re.sub(r'\s+', ' ', normalized)
+    # Remover caracteres especiales pero mantener espacios
+    normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
+
+    # Generar hash
+    hash_obj = _get_error_hash_algorithm()(normalized.encode('utf-8'))
+    return hash_obj.hexdigest()
+
+
 def format_timestamp(dt: Optional[datetime] = None) -> str:
     """
     Formatea un timestamp de forma consistente.
@@ -396,6 +453,28 @@ def format_timestamp(dt: Optional[datetime] = None) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S')
 
 
+# [segundo epoch, ISO] del ultimo timestamp UTC generado
+_ISO_TS_CACHE = [0, '']
+
+
+def utc_now_iso() -> str:
+    """
+    Timestamp UTC actual en ISO 8601 con resolucion de segundos.
+
+    Reutiliza el string mientras no cambie el segundo, evitando construir
+    un datetime por cada escritura.
+
+    Returns:
+        str: Timestamp ISO (p.ej. '2024-01-01T12:00:00')
+    """
+    now = int(time.time())
+    cache = _ISO_TS_CACHE
+    if cache[0] != now:
+        cache[1] = datetime.utcfromtimestamp(now).isoformat()
+        cache[0] = now
+    return cache[1]
+
+
 # ============================================================================
 # Inicializacion del Logger Manager al importar el modulo
 # ============================================================================